@@ -7,7 +7,6 @@ import threading
 import sys
 import pystray # For tray icon
 from PIL import Image
-import re # Added for password validation in handle_first_run
 
 # --- Controllers ---
 from controllers.config_manager import ConfigManager
@@ -29,7 +28,8 @@ from views.dialogs import ToolTip
 from views.dialogs import (
     BaseDialog, ErrorDialog, RecoveryKeyDialog, 
     ProvisionDialog, InviteDialog, ConfirmationDialog, 
-    LogViewerDialog, ServerDialog, TunnelDialog, ProvisioningLogDialog
+    LogViewerDialog, ServerDialog, TunnelDialog, ProvisioningLogDialog,
+    password_chars_allowed
 )
 
 class App(ctk.CTk):
@@ -81,6 +81,7 @@ class App(ctk.CTk):
         self.is_shutting_down = False
         self.syncthing_id_ready = threading.Event()
         self.sidebar_is_collapsed = False # State for new sidebar
+        self._client_dropdown_cache = None # (key, (client_map, client_names)); see get_clients_for_dropdown
 
         # --- Load Assets ---
         self.images = self._load_images()
@@ -227,8 +228,7 @@ class App(ctk.CTk):
             
             # --- Add tooltip for collapsed mode ---
             if self.tooltip:
-                btn.bind("<Enter>", lambda e, text=text: self.tooltip.schedule_show(e, text))
-                btn.bind("<Leave>", self.tooltip.schedule_hide)
+                self.tooltip.attach(btn, text)
             
             # --- Store button in cache ---
             self.nav_buttons.append(btn)
@@ -461,14 +461,13 @@ class App(ctk.CTk):
         password = self.setup_entry1.get()
         password2 = self.setup_entry2.get()
         
-        allowed_chars = r"^[A-Za-z0-9 !@#$%^&*()_+\-=\[\]{}|;:,.<>?]*$"
         if password != password2:
             self.show_error("Setup Error", "Passwords do not match.")
             return
         if not password:
             self.show_error("Setup Error", "Password cannot be empty.")
             return
-        if not re.fullmatch(allowed_chars, password):
+        if not password_chars_allowed(password):
             self.show_error("Setup Error", "Password contains invalid characters..."); return
             
         unlocked, recovery_key = self.config_manager.unlock_with_password(password)
@@ -710,10 +709,17 @@ class App(ctk.CTk):
         if ("DashboardView" in self.frames 
             and self.frames["DashboardView"] 
             and self.frames["DashboardView"].winfo_exists()):
-            self.after(0, self.frames["DashboardView"].sync_tunnel_list)
+            self.frames["DashboardView"].request_sync()
         else: 
             logging.debug("Skipping Tunnels refresh (frame not created/destroyed).")
              
+    def on_tunnel_status_changed(self):
+        """Callback from TunnelManager when a tunnel starts, stops or exits."""
+        if ("DashboardView" in self.frames
+            and self.frames["DashboardView"]
+            and self.frames["DashboardView"].winfo_exists()):
+            self.frames["DashboardView"].on_status_changed()
+
     def show_error(self, title: str, message: str = None):
         """Displays a modal error dialog."""
         if message is None: message = title
@@ -756,7 +762,9 @@ class App(ctk.CTk):
     # --- Passthrough Methods ---
     def get_object_by_id(self, obj_id: str): return self.config_manager.get_object_by_id(obj_id) if self.is_unlocked else None
     def get_tunnels(self): return self.config_manager.get_tunnels() if self.is_unlocked else []
+    def get_tunnels_sorted(self): return self.config_manager.get_tunnels_sorted() if self.is_unlocked else []
     def get_servers(self): return self.config_manager.get_servers() if self.is_unlocked else []
+    def get_server_choices(self): return self.config_manager.get_server_choices() if self.is_unlocked else ()
     def get_clients(self): return self.config_manager.get_clients() if self.is_unlocked else []
     def get_server_name(self, server_id: str): return self.config_manager.get_server_name(server_id) if self.is_unlocked else "Unknown"
     def get_client_name(self, client_id: str): return self.config_manager.get_client_name(client_id) if self.is_unlocked else client_id[:8] if client_id else "None"
@@ -782,8 +790,12 @@ class App(ctk.CTk):
     def get_tunnel_statuses(self) -> dict: return self.tunnel_manager.get_tunnel_statuses()
     def get_tunnel_log(self, tunnel_id: str) -> str: return self.tunnel_manager.get_tunnel_log(tunnel_id)
     def get_clients_for_dropdown(self) -> tuple[dict, list]:
-        client_map = {}; client_names = []
+        """(client_map, client_names) for client dropdowns; reused until the config or this device's identity changes."""
         my_id = self.get_my_device_id(); my_name = f"{self.get_my_device_name()} (This Device)"
+        cache_key = (self.get_config_version(), my_id, my_name)
+        cached = self._client_dropdown_cache
+        if cached and cached[0] == cache_key: return cached[1]
+        client_map = {}; client_names = []
         if my_id: client_map[my_name] = my_id; client_names.append(my_name)
         for client in self.get_clients():
             cid = client.get('syncthing_id'); cname = client.get('name') or f"Unknown ({cid[:7]}...)" if cid else "Invalid Client"
@@ -792,6 +804,7 @@ class App(ctk.CTk):
                 while display_name in client_map: count += 1; display_name = f"{cname} ({count})"
                 client_map[display_name] = cid; client_names.append(display_name)
         client_names = sorted(client_names, key=lambda x: (x != my_name, x))
+        self._client_dropdown_cache = (cache_key, (client_map, client_names))
         return client_map, client_names
     def get_debug_info(self) -> dict:
         info = { "app": {"is_unlocked": self.is_unlocked, "is_shutting_down": self.is_shutting_down, "syncthing_id_ready": self.syncthing_id_ready.is_set()}, "syncthing": {"is_running": self.syncthing_manager.is_running, "my_device_id": self.syncthing_manager.my_device_id, "api_client": bool(self.syncthing_manager.api_client), "exe_path": self.syncthing_manager.syncthing_exe_path, "sync_folder_path": self.syncthing_manager.sync_folder_path}, "tunnels": {"active_processes": {tid: p.pid for tid, p in self.tunnel_manager.active_tunnels.items() if p and p.poll() is None}, "error_messages": self.tunnel_manager.tunnel_error_messages, "log_keys": list(self.tunnel_manager.tunnel_logs.keys())}, "config": {"sync_path": self.config_manager.sync_path, "credentials_loaded": bool(self.config_manager._credentials), "object_count": len(self.config_manager._in_memory_state), "index_count": len(self.config_manager._file_index)} }
@@ -800,6 +813,10 @@ class App(ctk.CTk):
     def get_all_objects_for_debug(self):
         if not self.is_unlocked: return {}
         return self.config_manager.get_all_objects_for_debug()
+    def get_config_version(self):
+        """Changes whenever the in-memory configuration is reloaded; None while locked."""
+        if not self.is_unlocked: return None
+        return self.config_manager.config_version
     def get_history_file_index(self):
         if not self.is_unlocked: return []
         return self.config_manager.get_history_file_index()
@@ -22,6 +22,9 @@ class ConfigManager:
         self._in_memory_state = {}
         self._file_index = {}
         self._credentials = None
+        self._sorted_tunnels = None # Cache for get_tunnels_sorted(), reset on every reload
+        self._server_choices = None # Cache for get_server_choices(), reset on every reload
+        self.config_version = 0 # Bumped on every reload so views can tell the state changed
 
         os.makedirs(self.history_dir, exist_ok=True)
 
@@ -122,6 +125,9 @@ class ConfigManager:
         
         history_files = sorted(os.listdir(self.history_dir))
         self._in_memory_state = self._reconstruct_state_from_events(history_files)
+        self._sorted_tunnels = None
+        self._server_choices = None
+        self.config_version += 1
         logging.debug(f"Reconstructed state dump: {json.dumps(self._in_memory_state, indent=2)}")
         logging.info(f"Configuration loaded with {len(self._in_memory_state)} objects.")
 
@@ -214,10 +220,31 @@ class ConfigManager:
         tunnels = [obj for obj in self._in_memory_state.values() if obj.get('type') == 'tunnel' or ('hostname' in obj and not obj.get('type'))]
         return sorted(tunnels, key=lambda x: x.get('hostname', '').lower())
 
+    def get_tunnels_sorted(self):
+        """
+        Tunnels ordered by (server name, hostname) for display.
+        Cached until the configuration is reloaded; callers must not modify the list.
+        """
+        if self._sorted_tunnels is None:
+            tunnels = self.get_tunnels()
+            server_names = {sid: self.get_server_name(sid) for sid in {t.get('server_id', '') for t in tunnels}}
+            self._sorted_tunnels = sorted(tunnels, key=lambda t: (server_names[t.get('server_id', '')], t.get('hostname', '')))
+        return self._sorted_tunnels
+
     def get_servers(self):
         servers = [obj for obj in self._in_memory_state.values() if obj.get('type') == 'server' or ('ip_address' in obj and not obj.get('type'))]
         return sorted(servers, key=lambda x: x.get('name', '').lower())
     
+    def get_server_choices(self):
+        """
+        ((name, id), ...) for server dropdowns, one entry per name, sorted by name.
+        Cached until the configuration is reloaded.
+        """
+        if self._server_choices is None:
+            by_name = {s.get('name', 'N/A'): s.get('id', 'N/A') for s in self.get_servers()}
+            self._server_choices = tuple(sorted(by_name.items()))
+        return self._server_choices
+    
     def get_clients(self): 
         my_id = self.controller.get_my_device_id() or "" 
         clients = [obj for obj in self._in_memory_state.values() if obj.get('type') == 'client' and obj.get('syncthing_id') != my_id]
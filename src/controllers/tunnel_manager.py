@@ -17,6 +17,7 @@ class TunnelManager:
         self.active_tunnels = {} # { tunnel_id: subprocess.Popen }
         self.tunnel_logs = {} # { tunnel_id: deque() }
         self.tunnel_error_messages = {} # { tunnel_id: "error message" }
+        self.exited_tunnels = {} # { tunnel_id: "status message" } for processes that exited on their own
         self.ssh_executable = "C:\\Windows\\System32\\OpenSSH\\ssh.exe"
         self._lock = threading.Lock()
 
@@ -49,7 +50,7 @@ class TunnelManager:
             self.stop_tunnel(tunnel_id, refresh_ui=False)
 
         logging.info("All active tunnels stopped.")
-        self.controller.refresh_dashboard()
+        self.controller.on_tunnel_status_changed()
 
 
     def _monitor_tunnels(self):
@@ -59,13 +60,16 @@ class TunnelManager:
                 exited_tunnels_ids = []
                 with self._lock:
                     for tid, process in list(self.active_tunnels.items()):
-                        if process and process.poll() is not None:
+                        exit_code = process.poll() if process else None
+                        if exit_code is not None:
                             exited_tunnels_ids.append(tid)
-                            self.active_tunnels.pop(tid, None) 
+                            # Keep the error for get_tunnel_statuses before dropping the handle
+                            self.exited_tunnels[tid] = self.tunnel_error_messages.get(tid, f"Exited unexpectedly (Code: {exit_code})")
+                            self.active_tunnels.pop(tid, None)
 
                 if exited_tunnels_ids:
                     logging.info(f"Monitor detected exited tunnels: {exited_tunnels_ids}.")
-                    self.controller.after(0, self.controller.refresh_dashboard)
+                    self.controller.after(0, self.controller.on_tunnel_status_changed)
 
                 time.sleep(5)
 
@@ -125,6 +129,7 @@ class TunnelManager:
                     self.active_tunnels.pop(tunnel_id, None)
 
             self.tunnel_error_messages.pop(tunnel_id, None)
+            self.exited_tunnels.pop(tunnel_id, None)
             self.tunnel_logs.pop(tunnel_id, None)
 
             tunnel_config = self.controller.get_object_by_id(tunnel_id)
@@ -239,7 +244,7 @@ class TunnelManager:
                 threading.Thread(target=self._stream_reader, args=(process.stderr, tunnel_id, "stderr"), daemon=True).start()
 
                 if hasattr(self.controller, 'after'):
-                    self.controller.after(0, self.controller.refresh_dashboard)
+                    self.controller.after(0, self.controller.on_tunnel_status_changed)
 
                 return True, "Process started."
             except FileNotFoundError:
@@ -259,6 +264,7 @@ class TunnelManager:
 
         with self._lock:
             self.tunnel_error_messages.pop(tunnel_id, None)
+            self.exited_tunnels.pop(tunnel_id, None)
             process_handle = self.active_tunnels.pop(tunnel_id, None) # Remove entry first
 
             if not process_handle:
@@ -337,7 +343,7 @@ class TunnelManager:
         if refresh_ui:
             logging.debug(f"[{tunnel_id}] Scheduling UI refresh...")
             try:
-                if hasattr(self.controller, 'after'): self.controller.after(0, self.controller.refresh_dashboard)
+                if hasattr(self.controller, 'after'): self.controller.after(0, self.controller.on_tunnel_status_changed)
                 else: logging.error(f"[{tunnel_id}] Controller has no 'after' method.")
             except Exception as e: logging.error(f"[{tunnel_id}] Error scheduling UI refresh: {e}")
 
@@ -364,7 +370,7 @@ class TunnelManager:
             else: failed_count += 1
 
         logging.info(f"Attempted to start {started_count} auto-start tunnels ({failed_count} failures).")
-        self.controller.after(50, self.controller.refresh_dashboard)
+        self.controller.after(50, self.controller.on_tunnel_status_changed)
 
     def get_tunnel_statuses(self) -> dict:
         """Gets the status of all tunnels."""
@@ -389,6 +395,7 @@ class TunnelManager:
             else: 
                 with self._lock:
                     error_msg = self.tunnel_error_messages.get(tunnel_id, f"Exited unexpectedly (Code: {exit_code})")
+                    self.exited_tunnels[tunnel_id] = error_msg
                     self.active_tunnels.pop(tunnel_id, None) 
 
                 logging.warning(f"Tunnel {tunnel_id} found exited unexpectedly. Status message: {error_msg}")
@@ -396,13 +403,24 @@ class TunnelManager:
                 processed_ids.add(tunnel_id)
 
         all_tunnel_configs = self.controller.get_tunnels()
+
+        with self._lock:
+            # Forget exits of tunnels that have since been deleted
+            configured_ids = {tunnel['id'] for tunnel in all_tunnel_configs}
+            for tid in self.exited_tunnels.keys() - configured_ids:
+                del self.exited_tunnels[tid]
+            exited = dict(self.exited_tunnels)
+
         my_device_id = self.controller.get_my_device_id()
 
         for tunnel in all_tunnel_configs:
             tid = tunnel['id']
             if tid not in processed_ids:
                 assigned_id = tunnel.get('client_device_id')
-                if assigned_id == my_device_id:
+                if tid in exited:
+                    # Crashed until it is started or stopped again
+                    statuses[tid] = {'status': 'error', 'message': exited[tid]}
+                elif assigned_id == my_device_id:
                     statuses[tid] = {'status': 'stopped', 'message': 'Stopped'}
                 elif not assigned_id:
                      statuses[tid] = {'status': 'stopped', 'message': 'Stopped (Unassigned)'}
@@ -1,9 +1,28 @@
 import customtkinter as ctk
 import logging
+from functools import partial
 from .dialogs import ToolTip # Assuming ToolTip is still your Toplevel-based class
 import tkinter # Import tkinter for checking widget existence
 
+# --- Status lookup tables (shared by all rows) ---
+# status_key -> (color, default_text, icon); a None color means the theme's label text color
+STATUS_STYLES = {
+    "running": ("#2E7D32", "Connected", "✅"), # Green
+    "stopped": (None, "Stopped", "⚪"), # Default text color
+    "error": ("#D32F2F", "Error", "⚠️"), # Red
+    "disabled": ("#616161", "Managed Elsewhere", "🔘") # Gray
+}
+# Anything not listed falls back to the "start" variant / "normal" state
+STARTSTOP_TOOLTIPS = {"running": "Stop Tunnel"}
+STARTSTOP_BUTTON_STATES = {"disabled": "disabled"}
+
 class DashboardView(ctk.CTkFrame):
+    # Pack options for the widgets inside tunnel_list_frame (applied by _repack_tunnel_list)
+    HEADER_PACK_OPTIONS = {"fill": "x", "padx": 5, "pady": (10, 5), "ipady": 2}
+    ITEM_PACK_OPTIONS = {"fill": "x", "pady": 5, "padx": 5}
+    # Max number of removed tunnel rows kept for reuse instead of being destroyed
+    ITEM_POOL_SIZE = 32
+
     def __init__(self, parent, controller):
         super().__init__(parent, fg_color="transparent")
         self.controller = controller
@@ -16,14 +35,24 @@ class DashboardView(ctk.CTkFrame):
              logging.error("DashboardView: Tooltip instance not found in controller!")
         # --- End Tooltip Section ---
         
+        # --- Start/Stop button images (looked up once, used on every status update) ---
+        self._img_start = self.images.get("start")
+        self._img_stop = self.images.get("stop")
+
         # --- Status Colors ---
         default_text_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        # status_key -> (color, default_text, icon), resolved with a single lookup per update
         self.status_colors = {
-            "running": ("#2E7D32", "Connected"), # Green
-            "stopped": (default_text_color, "Stopped"), # Default text color
-            "error": ("#D32F2F", "Error"), # Red
-            "disabled": ("#616161", "Managed Elsewhere") # Gray
+            key: (color or default_text_color, text, icon)
+            for key, (color, text, icon) in STATUS_STYLES.items()
         }
+        self._status_default = self.status_colors["stopped"]
+
+        # --- Fonts (one CTkFont per style, shared by every row/header instead of one per widget) ---
+        self._header_font = ctk.CTkFont(size=14, weight="bold")
+        self._info_font = ctk.CTkFont(weight="bold")
+        legend_icon_font = ctk.CTkFont(size=14)
+        legend_text_font = ctk.CTkFont(size=12)
 
         # --- Grid Configuration for DashboardView Frame ---
         self.grid_columnconfigure(0, weight=1) # The single column expands horizontally
@@ -57,6 +86,8 @@ class DashboardView(ctk.CTkFrame):
         self.tunnel_list_frame = ctk.CTkScrollableFrame(self.list_container, label_text="Configured Tunnels")
         self.tunnel_list_frame.grid(row=0, column=0, sticky="nsew")
         self.tunnel_list_frame.grid_columnconfigure(0, weight=1)
+        # Created once and packed/unpacked by sync_tunnel_list
+        self._empty_label = ctk.CTkLabel(self.tunnel_list_frame, text="No tunnels configured...")
 
 
         # --- Bottom Legend Frame (Row 2 - Fixed Height) ---
@@ -64,41 +95,41 @@ class DashboardView(ctk.CTkFrame):
         self.legend_frame.grid(row=2, column=0, padx=10, pady=(0, 5), sticky="ew")
         ctk.CTkLabel(self.legend_frame, text="Legend:").pack(side="left", padx=(5, 10))
         legend_items = [
-            ("✅", self.status_colors["running"][0], "Running"),
-            ("⚠️", self.status_colors["error"][0], "Error"),
-            ("⚪", self.status_colors["stopped"][0], "Stopped"),
-            ("🔘", self.status_colors["disabled"][0], "Managed Elsewhere")
+            ("running", "Running"),
+            ("error", "Error"),
+            ("stopped", "Stopped"),
+            ("disabled", "Managed Elsewhere")
         ]
-        for icon, color, text in legend_items:
+        for status_key, text in legend_items:
+             color, _, icon = self.status_colors[status_key]
              item_frame = ctk.CTkFrame(self.legend_frame, fg_color="transparent")
              item_frame.pack(side="left", padx=5)
-             ctk.CTkLabel(item_frame, text=icon, text_color=color, font=ctk.CTkFont(size=14)).pack(side="left")
-             ctk.CTkLabel(item_frame, text=text, font=ctk.CTkFont(size=12)).pack(side="left", padx=(2, 0))
+             ctk.CTkLabel(item_frame, text=icon, text_color=color, font=legend_icon_font).pack(side="left")
+             ctk.CTkLabel(item_frame, text=text, font=legend_text_font).pack(side="left", padx=(2, 0))
 
         # --- Internal State ---
-        self.status_check_timer = None
+        self._status_refresh_pending = False
+        self._sync_job = None # after id of the pending coalesced sync, if any
         self.tunnel_item_frames = {} # {tunnel_id: item_frame_widget}
         self.server_header_frames = {} # {server_name: header_widget}
+        self._item_pool = [] # Unpacked item frames ready to be rebound to another tunnel
+        self._packed_order = [] # Widgets as last packed by _repack_tunnel_list
         
     def on_enter(self):
         """Called when view is shown. Performs a full sync/rebuild."""
         logging.debug("Entering DashboardView.")
+        if self._sync_job:
+            # The full sync below covers any request queued before the view was shown
+            self.after_cancel(self._sync_job)
+            self._sync_job = None
         self.sync_tunnel_list() # Use the differential sync method
-        self.poll_statuses() # Start polling
+        # Status changes are pushed by the controller (on_status_changed); no polling timer.
 
     def on_leave(self):
         """Called when view is hidden."""
         logging.debug("Leaving DashboardView.")
         
-        # 1. Stop the polling timer
-        if self.status_check_timer:
-            try: 
-                self.after_cancel(self.status_check_timer)
-            except ValueError: 
-                pass
-            self.status_check_timer = None
-
-        # 2. Hide any active tooltip immediately
+        # Hide any active tooltip immediately
         if self.shared_tooltip:
             try:
                 # --- FIX: Use schedule_hide ---
@@ -109,13 +140,43 @@ class DashboardView(ctk.CTkFrame):
         # --- DO NOT destroy widgets or clear caches here ---
         # The sync_tunnel_list method will handle this when we return.
 
-    def poll_statuses(self):
-        """Periodically polls tunnel statuses and refreshes UI if needed."""
-        if not self.winfo_exists() or not self.winfo_viewable():
-            self.status_check_timer = None
+    def on_status_changed(self):
+        """
+        Called by the controller when tunnel statuses change.
+        Coalesces bursts of notifications into a single refresh at idle time.
+        """
+        if self._status_refresh_pending:
             return
+        self._status_refresh_pending = True
+        self.after_idle(self._run_status_refresh)
+
+    def _run_status_refresh(self):
+        """Runs the coalesced status refresh if the view is currently shown."""
+        self._status_refresh_pending = False
+        if self._sync_job:
+            return # The pending full sync refreshes statuses as well
+        if not self.winfo_exists() or not self.winfo_manager():
+            return # Hidden views are fully re-synced by on_enter
         self.refresh_tunnel_statuses() # Call lightweight status update
-        self.status_check_timer = self.after(2000, self.poll_statuses)
+
+    def request_sync(self, delay_ms: int = 0):
+        """
+        Schedules a sync_tunnel_list. Requests made while one is already pending
+        are folded into it, so bursts of config changes rebuild the list once.
+        """
+        if self._sync_job:
+            return
+        if delay_ms:
+            self._sync_job = self.after(delay_ms, self._run_sync)
+        else:
+            self._sync_job = self.after_idle(self._run_sync)
+
+    def _run_sync(self):
+        """Runs the coalesced sync if the view is currently shown."""
+        self._sync_job = None
+        if not self.winfo_exists() or not self.winfo_manager():
+            return # Hidden views are fully re-synced by on_enter
+        self.sync_tunnel_list()
 
     def sync_tunnel_list(self):
         """
@@ -125,23 +186,16 @@ class DashboardView(ctk.CTkFrame):
         """
         logging.debug("Synchronizing tunnel list UI.")
         try:
-            tunnels_config = self.controller.get_tunnels()
+            tunnels_config = self.controller.get_tunnels_sorted() # Already in display order
             if not tunnels_config: # No tunnels configured
-                 if self.tunnel_list_frame and self.tunnel_list_frame.winfo_exists():
-                      for widget in self.tunnel_list_frame.winfo_children():
-                           widget.destroy()
-                 self.tunnel_item_frames.clear()
-                 self.server_header_frames.clear()
-                 no_tunnels_label = ctk.CTkLabel(self.tunnel_list_frame, text="No tunnels configured...")
-                 no_tunnels_label.pack(pady=20)
-                 self.tunnel_item_frames["__no_tunnels_label__"] = no_tunnels_label 
+                 if self.tunnel_item_frames or self.server_header_frames:
+                      self._destroy_list_items()
+                 if not self._empty_label.winfo_manager():
+                      self._empty_label.pack(pady=20)
                  self.current_statuses = {} 
                  return
 
-            if "__no_tunnels_label__" in self.tunnel_item_frames:
-                 if self.tunnel_item_frames["__no_tunnels_label__"].winfo_exists():
-                      self.tunnel_item_frames["__no_tunnels_label__"].destroy()
-                 del self.tunnel_item_frames["__no_tunnels_label__"]
+            self._empty_label.pack_forget()
 
             self.current_statuses = self.controller.get_tunnel_statuses()
             config_ids = {t['id'] for t in tunnels_config}
@@ -151,39 +205,28 @@ class DashboardView(ctk.CTkFrame):
             for tunnel_id in ids_to_remove:
                 if tunnel_id in self.tunnel_item_frames:
                     logging.debug(f"Removing tunnel item {tunnel_id} from UI.")
-                    item_frame = self.tunnel_item_frames.pop(tunnel_id)
-                    if item_frame and item_frame.winfo_exists():
-                        item_frame.destroy()
+                    self._release_item(self.tunnel_item_frames.pop(tunnel_id))
                 self.current_statuses.pop(tunnel_id, None)
 
-            sorted_tunnels_config = sorted(tunnels_config, key=lambda t: (
-                self.controller.get_server_name(t.get('server_id', '')), t.get('hostname', '')
-            ))
+            # Resolve each server name once per sync instead of once per tunnel
+            server_name_cache = {sid: self.controller.get_server_name(sid)
+                                 for sid in {t.get('server_id', '') for t in tunnels_config}}
 
             processed_server_headers = set()
-            last_packed_widget = None 
+            ordered_widgets = [] # [(widget, pack_options)] in display order
 
-            for tunnel in sorted_tunnels_config:
+            for tunnel in tunnels_config:
                 tunnel_id = tunnel['id']
-                server_name = self.controller.get_server_name(tunnel.get('server_id', ''))
+                server_name = server_name_cache[tunnel.get('server_id', '')]
 
                 if server_name not in self.server_header_frames:
                     header = ctk.CTkLabel(self.tunnel_list_frame, text=server_name,
-                                          font=ctk.CTkFont(size=14, weight="bold"),
+                                          font=self._header_font,
                                           anchor="w", fg_color=("gray90", "gray20"))
-                    if last_packed_widget:
-                        header.pack(fill="x", padx=5, pady=(10, 5), ipady=2, after=last_packed_widget)
-                    else:
-                        header.pack(fill="x", padx=5, pady=(10, 5), ipady=2)
                     self.server_header_frames[server_name] = header
-                    last_packed_widget = header
+                    ordered_widgets.append((header, self.HEADER_PACK_OPTIONS))
                 elif server_name not in processed_server_headers:
-                     header = self.server_header_frames[server_name]
-                     if last_packed_widget:
-                          header.pack_configure(after=last_packed_widget)
-                     else:
-                          header.pack_configure() 
-                     last_packed_widget = header
+                     ordered_widgets.append((self.server_header_frames[server_name], self.HEADER_PACK_OPTIONS))
                 processed_server_headers.add(server_name)
 
 
@@ -191,21 +234,17 @@ class DashboardView(ctk.CTkFrame):
                 if tunnel_id in self.tunnel_item_frames:
                     item_frame = self.tunnel_item_frames[tunnel_id]
                     if item_frame.winfo_exists():
+                        self._bind_item_to_tunnel(item_frame, tunnel)
                         self._update_item_status(item_frame, status_obj)
-                        if last_packed_widget:
-                             item_frame.pack_configure(after=last_packed_widget)
-                        else:
-                             item_frame.pack_configure()
-                        last_packed_widget = item_frame
                     else:
                          logging.warning(f"Found invalid frame for {tunnel_id} during sync, recreating.")
                          del self.tunnel_item_frames[tunnel_id]
-                         item_frame = self._create_tunnel_item(tunnel, after_widget=last_packed_widget)
-                         last_packed_widget = item_frame
+                         item_frame = self._create_tunnel_item(tunnel)
                 else:
                     logging.debug(f"Adding tunnel item {tunnel_id} to UI.")
-                    item_frame = self._create_tunnel_item(tunnel, after_widget=last_packed_widget)
-                    last_packed_widget = item_frame
+                    item_frame = self._create_tunnel_item(tunnel)
+                if item_frame:
+                    ordered_widgets.append((item_frame, self.ITEM_PACK_OPTIONS))
 
             headers_to_remove = set(self.server_header_frames.keys()) - processed_server_headers
             for server_name in headers_to_remove:
@@ -214,38 +253,76 @@ class DashboardView(ctk.CTkFrame):
                  if header and header.winfo_exists():
                       header.destroy()
 
+            self._repack_tunnel_list(ordered_widgets)
+
         except Exception as e:
             logging.error(f"Error during tunnel list sync: {e}", exc_info=True)
             if self.tunnel_list_frame and self.tunnel_list_frame.winfo_exists():
-                 for widget in self.tunnel_list_frame.winfo_children(): widget.destroy()
+                 self._destroy_list_items()
                  ctk.CTkLabel(self.tunnel_list_frame, text="Error loading tunnels.", text_color="red").pack(pady=20)
 
 
-    def _create_tunnel_item(self, tunnel: dict, after_widget=None):
-        """Creates widgets for a tunnel item, binds events, packs, and returns the frame."""
+    def _destroy_list_items(self):
+        """Destroys every widget in the tunnel list except the reusable empty-list label."""
+        for widget in self.tunnel_list_frame.winfo_children():
+            if widget is not self._empty_label:
+                widget.destroy()
+        self.tunnel_item_frames.clear()
+        self.server_header_frames.clear()
+        self._item_pool.clear()
+        self._packed_order = []
+
+    def _release_item(self, item_frame):
+        """Unpacks a removed tunnel row and keeps it for reuse, or destroys it if the pool is full."""
+        self._packed_order = [] # The packed list changes here; force the next repack
+        if not item_frame or not item_frame.winfo_exists():
+            return
+        if len(self._item_pool) < self.ITEM_POOL_SIZE:
+            item_frame.pack_forget()
+            item_frame.tunnel_id = None
+            self._item_pool.append(item_frame)
+        else:
+            item_frame.destroy()
+
+    def _repack_tunnel_list(self, ordered_widgets: list):
+        """
+        Packs headers and tunnel items in display order in a single pass.
+        Skipped entirely (without querying Tk) when headers and rows are unchanged
+        since the last pack.
+        """
+        new_order = [widget for widget, _ in ordered_widgets]
+        if new_order == self._packed_order:
+            return
+        # Detach the scrollable frame while reordering so its canvas is laid out
+        # and redrawn once for the final order, not for each intermediate state.
+        self.tunnel_list_frame.grid_remove()
+        try:
+            for widget in self.tunnel_list_frame.pack_slaves():
+                widget.pack_forget()
+            for widget, pack_options in ordered_widgets:
+                widget.pack(**pack_options)
+        finally:
+            self.tunnel_list_frame.grid()
+        self._packed_order = new_order
+
+    def _create_tunnel_item(self, tunnel: dict):
+        """Returns an (unpacked) item frame showing the tunnel, reusing a pooled frame if possible."""
         tunnel_id = tunnel.get('id')
         if not tunnel_id: return None
 
-        status_obj = self.current_statuses.get(tunnel_id, {'status': 'stopped', 'message': 'Stopped'})
-
-        item_frame = ctk.CTkFrame(self.tunnel_list_frame)
-        if after_widget:
-            item_frame.pack(fill="x", pady=5, padx=5, after=after_widget)
-        else:
-             item_frame.pack(fill="x", pady=5, padx=5) 
-
-        item_frame.grid_columnconfigure(1, weight=1)
+        item_frame = self._item_pool.pop() if self._item_pool else self._build_item_frame()
         item_frame.tunnel_id = tunnel_id
+        item_frame.tooltip_hostname = None
+        self._bind_item_to_tunnel(item_frame, tunnel)
 
-        status_label = ctk.CTkLabel(item_frame, text="", anchor="w", justify="left")
-        status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-        item_frame.status_label = status_label
-        # --- FIX: Tooltip binding ---
-        if self.shared_tooltip:
-            status_label.bind("<Enter>", lambda event, tid=tunnel_id: self._bind_status_tooltip(event, tid))
-            status_label.bind("<Leave>", self.shared_tooltip.schedule_hide)
+        status_obj = self.current_statuses.get(tunnel_id, {'status': 'stopped', 'message': 'Stopped'})
+        self._update_item_status(item_frame, status_obj)
 
+        self.tunnel_item_frames[tunnel_id] = item_frame
+        return item_frame 
 
+    def _bind_item_to_tunnel(self, item_frame, tunnel: dict):
+        """Updates a row's info text and tooltips, touching only what changed since the last sync."""
         hostname = tunnel.get('hostname', 'N/A')
         remote_port = tunnel.get('remote_port', 'N/A')
         
@@ -261,114 +338,122 @@ class DashboardView(ctk.CTkFrame):
              info_text = f"{hostname} (Port: {remote_port}) -> {local_dest}"
         # --- *** END UPDATE *** ---
 
-        info_label = ctk.CTkLabel(item_frame, text=info_text, font=ctk.CTkFont(weight="bold"), anchor="w")
-        info_label.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        if item_frame.info_text != info_text:
+            item_frame.info_label.configure(text=info_text)
+            item_frame.info_text = info_text
 
-        btn_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        btn_frame.grid(row=0, column=2, padx=(5, 10), pady=5, sticky="e")
-        btn_width = 30
+        if not self.shared_tooltip or item_frame.tooltip_hostname == hostname:
+            return
+        item_frame.tooltip_hostname = hostname
+        self.shared_tooltip.attach(item_frame.logs_btn, f"View Logs for {hostname}")
+        self.shared_tooltip.attach(item_frame.edit_btn, f"Edit {hostname}")
+        self.shared_tooltip.attach(item_frame.delete_btn, f"Delete {hostname}")
 
-        start_stop_btn = ctk.CTkButton(btn_frame, text="", width=btn_width)
-        start_stop_btn.pack(side="left", padx=3)
-        item_frame.start_stop_btn = start_stop_btn
-        # --- FIX: Tooltip binding ---
-        if self.shared_tooltip:
-            start_stop_btn.bind("<Enter>", lambda event, tid=tunnel_id: self._bind_startstop_tooltip(event, tid))
-            start_stop_btn.bind("<Leave>", self.shared_tooltip.schedule_hide)
+    def _build_item_frame(self):
+        """
+        Creates the widgets of a tunnel row. Button commands resolve the row's current
+        tunnel_id when clicked, so a pooled row can be rebound without reconfiguring them.
+        """
+        item_frame = ctk.CTkFrame(self.tunnel_list_frame)
+        item_frame.grid_columnconfigure(1, weight=1)
+        item_frame.tunnel_id = None
+        item_frame.info_text = ""
+        item_frame.tooltip_hostname = None
+        item_frame._start_cmd = partial(self._run_item_action, item_frame, self.controller.start_tunnel)
+        item_frame._stop_cmd = partial(self._run_item_action, item_frame, self.controller.stop_tunnel)
 
-        logs_btn = ctk.CTkButton(btn_frame, text="", width=btn_width, image=self.images.get("logs"), command=lambda tid=tunnel_id: self.controller.view_tunnel_log(tid))
-        logs_btn.pack(side="left", padx=3)
-        logs_text = f"View Logs for {hostname}"
-        # --- FIX: Tooltip binding ---
-        if self.shared_tooltip:
-            logs_btn.bind("<Enter>", lambda e, text=logs_text: self.shared_tooltip.schedule_show(e, text))
-            logs_btn.bind("<Leave>", self.shared_tooltip.schedule_hide)
+        item_frame.status_label = ctk.CTkLabel(item_frame, text="", anchor="w", justify="left")
+        item_frame.status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
-        edit_btn = ctk.CTkButton(btn_frame, text="", width=btn_width, image=self.images.get("edit"), command=lambda tid=tunnel_id: self.controller.edit_tunnel(tid))
-        edit_btn.pack(side="left", padx=3)
-        edit_text = f"Edit {hostname}"
-        # --- FIX: Tooltip binding ---
-        if self.shared_tooltip:
-            edit_btn.bind("<Enter>", lambda e, text=edit_text: self.shared_tooltip.schedule_show(e, text))
-            edit_btn.bind("<Leave>", self.shared_tooltip.schedule_hide)
+        item_frame.info_label = ctk.CTkLabel(item_frame, text="", font=self._info_font, anchor="w")
+        item_frame.info_label.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
-        delete_btn = ctk.CTkButton(btn_frame, text="", width=btn_width, image=self.images.get("delete"), fg_color="#D32F2F", hover_color="#B71C1C", command=lambda tid=tunnel_id: self.controller.delete_tunnel(tid))
-        delete_btn.pack(side="left", padx=3)
-        delete_text = f"Delete {hostname}"
-        # --- FIX: Tooltip binding ---
-        if self.shared_tooltip:
-            delete_btn.bind("<Enter>", lambda e, text=delete_text: self.shared_tooltip.schedule_show(e, text))
-            delete_btn.bind("<Leave>", self.shared_tooltip.schedule_hide)
+        # Buttons are gridded straight into the row (no inner button frame), saving one
+        # CTk canvas per row
+        btn_width = 30
 
-        self._update_item_status(item_frame, status_obj)
+        item_frame.start_stop_btn = ctk.CTkButton(item_frame, text="", width=btn_width)
+        item_frame.start_stop_btn.grid(row=0, column=2, padx=(8, 3), pady=5)
 
-        self.tunnel_item_frames[tunnel_id] = item_frame
-        return item_frame 
+        item_frame.logs_btn = ctk.CTkButton(item_frame, text="", width=btn_width, image=self.images.get("logs"), command=partial(self._run_item_action, item_frame, self.controller.view_tunnel_log))
+        item_frame.logs_btn.grid(row=0, column=3, padx=3, pady=5)
 
-    def _bind_status_tooltip(self, event, tunnel_id):
-        """Helper to get dynamic status text for tooltip binding."""
-        if not self.shared_tooltip: return
-        try:
-            status_obj = self.current_statuses.get(tunnel_id, {})
-            status_key = status_obj.get('status', 'stopped')
-            status_message = status_obj.get('message', self.status_colors.get(status_key, ["","Unknown"])[1])
-            tooltip_text = f"Status: {status_message}"
-            if status_key == "error" and "Port in use" in status_message: tooltip_text += "\n(Server port busy or stale connection)"
-            elif status_key == "error" and "Permission denied" in status_message: tooltip_text += "\n(Check SSH key setup)"
-            
-            # --- FIX: Pass text to schedule_show method ---
-            self.shared_tooltip.schedule_show(event, tooltip_text)
-        except Exception as e:
-            logging.error(f"Error in _bind_status_tooltip: {e}")
+        item_frame.edit_btn = ctk.CTkButton(item_frame, text="", width=btn_width, image=self.images.get("edit"), command=partial(self._run_item_action, item_frame, self.controller.edit_tunnel))
+        item_frame.edit_btn.grid(row=0, column=4, padx=3, pady=5)
 
-    def _bind_startstop_tooltip(self, event, tunnel_id):
-        """Helper to get dynamic start/stop text for tooltip binding."""
-        if not self.shared_tooltip: return
-        try:
-            status_obj = self.current_statuses.get(tunnel_id, {})
-            status_key = status_obj.get('status', 'stopped')
-            tooltip_text = "Stop Tunnel" if status_key == "running" else "Start Tunnel"
-            
-            # --- FIX: Pass text to schedule_show method ---
-            self.shared_tooltip.schedule_show(event, tooltip_text)
-        except Exception as e:
-            logging.error(f"Error in _bind_startstop_tooltip: {e}")
+        item_frame.delete_btn = ctk.CTkButton(item_frame, text="", width=btn_width, image=self.images.get("delete"), fg_color="#D32F2F", hover_color="#B71C1C", command=partial(self._run_item_action, item_frame, self.controller.delete_tunnel))
+        item_frame.delete_btn.grid(row=0, column=5, padx=(3, 13), pady=5)
+
+        if self.shared_tooltip:
+            # Status-dependent tips are built on <Enter> for the row's current tunnel;
+            # the hostname ones are attached by _bind_item_to_tunnel
+            self.shared_tooltip.attach(item_frame.status_label, partial(self._status_tooltip_text, item_frame))
+            self.shared_tooltip.attach(item_frame.start_stop_btn, partial(self._startstop_tooltip_text, item_frame))
+        return item_frame
+
+    def _run_item_action(self, item_frame, action):
+        """Button command for tunnel rows: calls action with the row's current tunnel_id."""
+        if item_frame.tunnel_id:
+            action(item_frame.tunnel_id)
+
+    def _status_tooltip_text(self, item_frame) -> str:
+        """Builds the dynamic status tooltip text for a row's current tunnel."""
+        tunnel_id = item_frame.tunnel_id
+        if not tunnel_id: return ""
+        status_obj = self.current_statuses.get(tunnel_id, {})
+        status_key = status_obj.get('status', 'stopped')
+        status_message = status_obj.get('message', self.status_colors.get(status_key, ("", "Unknown", ""))[1])
+        tooltip_text = f"Status: {status_message}"
+        if status_key == "error" and "Port in use" in status_message: tooltip_text += "\n(Server port busy or stale connection)"
+        elif status_key == "error" and "Permission denied" in status_message: tooltip_text += "\n(Check SSH key setup)"
+        return tooltip_text
+
+    def _startstop_tooltip_text(self, item_frame) -> str:
+        """Builds the dynamic start/stop tooltip text for a row's current tunnel."""
+        tunnel_id = item_frame.tunnel_id
+        if not tunnel_id: return ""
+        status_key = self.current_statuses.get(tunnel_id, {}).get('status', 'stopped')
+        return STARTSTOP_TOOLTIPS.get(status_key, "Start Tunnel")
 
     def _update_item_status(self, item_frame: ctk.CTkFrame, status_obj: dict):
-        """Updates the status label and start/stop button for a tunnel item."""
-        try:
-            if not item_frame or not item_frame.winfo_exists():
-                return
-        except Exception:
-            return 
+        """
+        Updates the status label and start/stop button for a tunnel item.
+        Callers have already checked item_frame.winfo_exists(); its children live
+        exactly as long as the frame, so they are not re-checked here.
+        """
+        if not item_frame:
+            return
+        status_key = status_obj.get('status', 'stopped') 
+        # Nothing to format or configure if the row already reflects these inputs
+        input_key = (status_key, status_obj.get('message'))
+        if getattr(item_frame, '_last_status_key', None) == input_key:
+            return
 
         tunnel_id = item_frame.tunnel_id
-        status_key = status_obj.get('status', 'stopped') 
-        status_color, default_text = self.status_colors.get(status_key, self.status_colors["stopped"]) 
+        status_color, default_text, icon = self.status_colors.get(status_key, self._status_default) 
         status_message = status_obj.get('message', default_text) 
 
-        icon = "⚪"; 
-        if status_key == "running": icon = "✅"
-        elif status_key == "error": icon = "⚠️"
-        elif status_key == "disabled": icon = "🔘"
         status_text = f"{icon} {status_message}" 
 
+        # Skip the Tcl round trips entirely when the row already shows this status
+        label_key = (status_text, status_color)
         try:
-            if hasattr(item_frame, 'status_label') and item_frame.status_label.winfo_exists():
+            if getattr(item_frame, '_last_label_key', None) != label_key:
                 item_frame.status_label.configure(text=status_text, text_color=status_color)
+                item_frame._last_label_key = label_key
         except Exception as e:
             logging.warning(f"Error updating status label {tunnel_id}: {e}")
 
         try:
-            if hasattr(item_frame, 'start_stop_btn') and item_frame.start_stop_btn.winfo_exists():
+            if getattr(item_frame, '_last_btn_key', None) != status_key:
                 is_running = (status_key == "running")
                 
-                btn_image = self.images.get("stop") if is_running else self.images.get("start")
+                btn_image = self._img_stop if is_running else self._img_start
                 if not btn_image:
                      logging.warning(f"Missing image for {'stop' if is_running else 'start'} button!")
                 
-                btn_command = (lambda tid=tunnel_id: self.controller.stop_tunnel(tid)) if is_running else (lambda tid=tunnel_id: self.controller.start_tunnel(tid))
-                btn_state = "disabled" if status_key == "disabled" else "normal"
+                btn_command = item_frame._stop_cmd if is_running else item_frame._start_cmd
+                btn_state = STARTSTOP_BUTTON_STATES.get(status_key, "normal")
 
                 item_frame.start_stop_btn.configure(
                     image=btn_image,   
@@ -376,9 +461,15 @@ class DashboardView(ctk.CTkFrame):
                     state=btn_state,
                     text=""            
                 )
+                item_frame._last_btn_key = status_key
         except Exception as e:
             logging.warning(f"Error updating start/stop button {tunnel_id}: {e}")
 
+        # Only short-circuit future calls once both widgets were actually updated
+        if getattr(item_frame, '_last_label_key', None) == label_key and \
+           getattr(item_frame, '_last_btn_key', None) == status_key:
+            item_frame._last_status_key = input_key
+
     def refresh_tunnel_statuses(self):
         """
         Updates the status display for existing tunnel items based on current statuses.
@@ -393,9 +484,13 @@ class DashboardView(ctk.CTkFrame):
             if new_statuses == self.current_statuses:
                  return
 
+            previous_statuses = self.current_statuses
             self.current_statuses = new_statuses
 
             for tunnel_id, status_obj in new_statuses.items():
+                # Only touch widgets whose status actually changed
+                if previous_statuses.get(tunnel_id) == status_obj:
+                    continue
                 item_frame = self.tunnel_item_frames.get(tunnel_id)
                 if item_frame:
                     try:
@@ -413,10 +508,10 @@ class DashboardView(ctk.CTkFrame):
             deleted_ids = current_ui_ids - status_ids
             if deleted_ids:
                  logging.warning(f"Detected tunnels {deleted_ids} in UI cache but not in status. Re-sync needed.")
-                 self.after(100, self.sync_tunnel_list)
+                 self.request_sync(100)
 
 
         except Exception as e:
             logging.error(f"Error during status refresh: {e}", exc_info=True)
-            self.after(500, self.sync_tunnel_list)
+            self.request_sync(500)
             
\ No newline at end of file
@@ -1,38 +1,96 @@
 import customtkinter as ctk
 import json
 import logging # Added logging
+from functools import partial
+from .dialogs import ChunkedTextWriter
+
+try:
+    import orjson # Optional: native serializer, much faster for large objects
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj_data) -> str:
+    """Pretty-prints obj_data as JSON (2-space indent, sorted keys), via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass # e.g. non-str keys or huge ints; the stdlib handles those
+    return json.dumps(obj_data, indent=2, sort_keys=True)
+
+
+def _display_name(obj_id: str, obj_data: dict) -> str:
+    """Name shown (and sorted on) for a config object: hostname, then name, then shortened ID."""
+    return obj_data.get('hostname') or obj_data.get('name') or obj_id[:8]
 
 class DebugView(ctk.CTkFrame):
     """
     A view for developers to inspect the raw in-memory configuration state.
     """
+    # JSON longer than this is inserted in chunks (ChunkedTextWriter) so the UI stays responsive
+    JSON_INSERT_CHUNK = 64 * 1024
+    # JSON longer than this is shown truncated until "Show Full JSON" is clicked
+    JSON_DISPLAY_LIMIT = 200_000
+
     def __init__(self, parent, controller):
         # Set background to transparent to blend with the main content area
         super().__init__(parent, fg_color="transparent")
         self.controller = controller
+        self._built = False # Widgets are created by _build() on the first on_enter
+
+        self._json_cache = {} # {(config_version, obj_id): pretty JSON}, cleared when the version changes
+        self._json_cache_version = None # Config version the cached JSON was rendered from
+        self._rendered_version = None # Config version the object list was last built from
+        self._json_display_empty = True # Lets clearing an already empty display skip the textbox
+        self._full_json = None # Untruncated text while a truncated object is displayed
 
+    def _build(self):
+        """Creates the view's widgets. Deferred until the view is first shown, as most sessions never open it."""
         # Configure grid layout: two columns, right one expands
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1) # Row containing list and display expands vertically
 
         # --- Left Frame for Object List ---
         self.object_list_frame = ctk.CTkScrollableFrame(self, label_text="Config Objects")
-        self.object_list_frame.grid(row=0, column=0, padx=(10, 5), pady=10, sticky="nsew") # Added horizontal padding
+        self.object_list_frame.grid(row=0, column=0, rowspan=2, padx=(10, 5), pady=10, sticky="nsew") # Added horizontal padding
 
         # --- Right Frame for JSON Display ---
         self.json_display = ctk.CTkTextbox(self, wrap="none", font=("Courier New", 12)) # Changed wrap to "none"
         self.json_display.grid(row=0, column=1, padx=(5, 10), pady=10, sticky="nsew") # Added horizontal padding
         self.json_display.configure(state="disabled") # Start read-only
+        self._json_writer = ChunkedTextWriter(self.json_display, self.JSON_INSERT_CHUNK)
+        # Shown below the display only while a truncated object is selected
+        self.show_full_button = ctk.CTkButton(self, text="Show Full JSON", command=self._show_full_json)
+        self.show_full_button.grid(row=1, column=1, padx=(5, 10), pady=(0, 10), sticky="e")
+        self.show_full_button.grid_remove()
+        self._built = True
 
     def on_enter(self):
         """Called when the view is shown. Populates the object list."""
         logging.info("Entering Debug View.")
-        # Clear previous widgets in the list frame
-        for widget in self.object_list_frame.winfo_children():
-            widget.destroy()
-        # Clear the JSON display
-        self._clear_json_display()
+        if not self._built:
+            self._build()
+        # The object list only changes when the configuration is reloaded
+        version = self.controller.get_config_version()
+        if version is not None and version == self._rendered_version:
+            return
+        self._rendered_version = version
+        # Detach the list while it is rebuilt so it lays out once, not once per button
+        self.object_list_frame.grid_remove()
+        try:
+            # Clear previous widgets in the list frame
+            for widget in self.object_list_frame.winfo_children():
+                widget.destroy()
+            # Clear the JSON display; objects are re-fetched below, so cached text is stale
+            self._clear_json_display()
+            self._json_cache.clear()
+            self._populate_object_list()
+        finally:
+            self.object_list_frame.grid()
 
+    def _populate_object_list(self):
+        """Creates a button per config object (list frame is detached by the caller)."""
         try:
             all_objects = self.controller.get_all_objects_for_debug()
 
@@ -40,47 +98,91 @@ class DebugView(ctk.CTkFrame):
                 ctk.CTkLabel(self.object_list_frame, text="No objects in memory.").pack(padx=10, pady=10)
                 return
 
-            # Sort objects by type and then name/ID for consistent order
-            sorted_items = sorted(all_objects.items(), key=lambda item: (item[1].get('type', 'Unknown'), item[1].get('hostname', item[1].get('name', item[0]))))
+            # Decorate each object with its (type, display name) once, then sort by that
+            # tuple; obj_id breaks ties so the dicts themselves are never compared
+            decorated = [(obj_data.get('type', 'Unknown'), _display_name(obj_id, obj_data), obj_id, obj_data)
+                         for obj_id, obj_data in all_objects.items()]
+            decorated.sort(key=lambda entry: entry[:3])
 
-            for obj_id, obj_data in sorted_items:
+            for obj_type, name, obj_id, obj_data in decorated:
                 # Determine a display name for the button
-                obj_type = obj_data.get('type', 'Unknown')
-                # Prioritize hostname, then name, then fallback to shortened ID
-                name = obj_data.get('hostname') or obj_data.get('name') or obj_id[:8]
                 display_text = f"{obj_type.title()}: {name}"
 
                 btn = ctk.CTkButton(
                     self.object_list_frame,
                     text=display_text,
                     anchor="w", # Align text to the left
-                    command=lambda o=obj_data: self._show_object_details(o)
+                    command=partial(self._show_object_by_id, obj_id)
                 )
                 btn.pack(fill="x", padx=5, pady=(0, 5)) # Add spacing below buttons
 
         except Exception as e:
             logging.error(f"Error populating debug object list: {e}", exc_info=True)
+            self._rendered_version = None # Retry on the next on_enter
             ctk.CTkLabel(self.object_list_frame, text="Error loading objects.", text_color="red").pack(padx=10, pady=10)
 
     def _clear_json_display(self):
         """Clears the JSON display text box."""
         if self.json_display.winfo_exists():
-            self.json_display.configure(state="normal")
-            self.json_display.delete("1.0", "end")
-            self.json_display.configure(state="disabled")
+            self._set_truncated(None)
+            self._set_json_text("")
 
+    def _set_json_text(self, text: str):
+        """
+        Replaces the (read-only) JSON display content; texts longer than
+        JSON_INSERT_CHUNK finish over the following after() ticks.
+        """
+        if not text and self._json_display_empty:
+            self._json_writer.cancel()
+            return
+        self._json_writer.set_text(text)
+        self._json_display_empty = not text
 
-    def _show_object_details(self, obj_data: dict):
-        """Displays the formatted JSON for a selected object."""
+    def _show_object_by_id(self, obj_id: str):
+        """Button command for the object list."""
+        # Every save reloads the configuration (new version), so JSON from before is stale
+        version = self.controller.get_config_version()
+        if version != self._json_cache_version:
+            self._json_cache.clear()
+            self._json_cache_version = version
+        # Look the object up in the current state; the listed one may predate a reload
+        obj_data = self.controller.get_all_objects_for_debug().get(obj_id)
+        if obj_data is not None:
+            self._show_object_details(obj_data, (version, obj_id))
+
+    def _show_object_details(self, obj_data: dict, cache_key=None):
+        """Displays the formatted JSON for a selected object (cached under cache_key, if given)."""
         try:
-            self.json_display.configure(state="normal") # Enable writing
-            self.json_display.delete("1.0", "end") # Clear previous content
-            pretty_json = json.dumps(obj_data, indent=2, sort_keys=True) # Sort keys for readability
-            self.json_display.insert("1.0", pretty_json)
-            self.json_display.configure(state="disabled") # Make read-only again
+            pretty_json = self._json_cache.get(cache_key) if cache_key else None
+            if pretty_json is None:
+                pretty_json = _dumps(obj_data) # Sort keys for readability
+                if cache_key:
+                    self._json_cache[cache_key] = pretty_json
+            if len(pretty_json) > self.JSON_DISPLAY_LIMIT:
+                # Huge blobs (certificates, base64 payloads) would block the UI while inserted
+                self._set_truncated(pretty_json)
+                hidden = len(pretty_json) - self.JSON_DISPLAY_LIMIT
+                self._set_json_text(pretty_json[:self.JSON_DISPLAY_LIMIT] + f"\n... ({hidden} more characters truncated)")
+            else:
+                self._set_truncated(None)
+                self._set_json_text(pretty_json)
         except Exception as e:
             logging.error(f"Error displaying object details: {e}", exc_info=True)
-            self.json_display.configure(state="normal")
-            self.json_display.delete("1.0", "end")
-            self.json_display.insert("1.0", f"Error displaying JSON:\n{e}")
-            self.json_display.configure(state="disabled")
\ No newline at end of file
+            self._set_truncated(None)
+            self._set_json_text(f"Error displaying JSON:\n{e}")
+
+    def _set_truncated(self, full_json):
+        """Remembers the full text of a truncated object (None if not truncated) and shows/hides the button."""
+        self._full_json = full_json
+        if full_json is None:
+            self.show_full_button.grid_remove()
+        else:
+            self.show_full_button.grid()
+
+    def _show_full_json(self):
+        """Replaces a truncated display with the complete JSON, inserted in chunks."""
+        full_json = self._full_json
+        if full_json is None:
+            return
+        self._set_truncated(None)
+        self._set_json_text(full_json)
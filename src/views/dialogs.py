@@ -1,16 +1,92 @@
 import customtkinter as ctk
-import qrcode
-from PIL import Image
 import logging
-import re
+import string
 import os
-import io
 import tkinter # Added for winfo_exists checks
+import threading
+from collections import deque
+
+# Characters allowed in a master password (space included)
+PASSWORD_ALLOWED_CHARS = string.ascii_letters + string.digits + " !@#$%^&*()_+-=[]{}|;:,.<>?"
+_PASSWORD_STRIP_TABLE = str.maketrans("", "", PASSWORD_ALLOWED_CHARS)
+
+
+def password_chars_allowed(password: str) -> bool:
+    """True if password only uses PASSWORD_ALLOWED_CHARS (a single C-level translate pass)."""
+    return not password.translate(_PASSWORD_STRIP_TABLE)
+
+def _valid_port(text: str) -> bool:
+    """True for a TCP port number 1-65535 written in ASCII digits (no int() on junk input)."""
+    return 0 < len(text) <= 5 and text.isascii() and text.isdigit() and 0 < int(text) <= 65535
+
+class ChunkedTextWriter:
+    """
+    Writes text into a read-only CTkTextbox in newline-aligned chunks, one per after()
+    tick, so large logs or JSON don't block the UI while inserted. Uses after(1) rather
+    than after_idle: an update_idletasks() anywhere would run a whole after_idle chain
+    at once.
+    """
+    def __init__(self, textbox, chunk_size: int = 64 * 1024, on_drained=None):
+        self.textbox = textbox
+        self.chunk_size = chunk_size
+        self._on_drained = on_drained # Called after the last queued chunk is inserted
+        self._pending = deque()
+        self._job = None
+
+    def append(self, text: str):
+        """Appends text, queued behind any chunks still pending; the first chunk goes in now."""
+        self._queue(text)
+        if not self._job:
+            self._insert_next()
+
+    def set_text(self, text: str):
+        """Replaces the content; clearing and the first chunk share one state transition."""
+        self.cancel()
+        self._queue(text)
+        self._insert_next(clear=True)
+
+    def cancel(self):
+        """Drops the chunks not inserted yet."""
+        if self._job:
+            self.textbox.after_cancel(self._job)
+            self._job = None
+        self._pending.clear()
+
+    def _queue(self, text: str):
+        """Splits text into chunks of at most chunk_size, cut after a newline where possible."""
+        start = 0
+        while len(text) - start > self.chunk_size:
+            cut = text.rfind("\n", start, start + self.chunk_size)
+            end = cut + 1 if cut >= start else start + self.chunk_size
+            self._pending.append(text[start:end])
+            start = end
+        self._pending.append(text[start:])
+
+    def _insert_next(self, clear=False):
+        """Inserts one queued chunk and re-arms itself until the queue is empty."""
+        self._job = None
+        if not self.textbox.winfo_exists():
+            self._pending.clear()
+            return
+        self.textbox.configure(state="normal")
+        if clear:
+            self.textbox.delete("1.0", "end")
+        self.textbox.insert("end", self._pending.popleft())
+        self.textbox.configure(state="disabled")
+        if self._pending:
+            self._job = self.textbox.after(1, self._insert_next)
+        elif self._on_drained:
+            self._on_drained()
 
 class ToolTip(ctk.CTkToplevel):
     """
     A shared tooltip window that manages its own show/hide delays.
     """
+    # Bind tag carrying the <Enter>/<Leave> handlers for every widget passed to attach()
+    BINDTAG = "NydusTooltip"
+    # Max number of measured tooltip sizes kept (texts repeat: buttons, form fields)
+    SIZE_CACHE_LIMIT = 128
+
     def __init__(self, parent, show_delay_ms=500, hide_delay_ms=100):
         super().__init__(parent)
         self._parent = parent
@@ -32,21 +108,65 @@ class ToolTip(ctk.CTkToplevel):
         self._hide_id = None
         self._event = None
         self._text = ""
+        self._visible = False
+        self._size_cache = {} # {text: (width, height)} as measured after layout
+
+        # One class-level binding serves all attached widgets; they just carry the tag
+        self.bind_class(self.BINDTAG, "<Enter>", self._on_attached_enter)
+        self.bind_class(self.BINDTAG, "<Leave>", self.schedule_hide)
 
     def schedule_show(self, event, text: str):
         """Schedules the tooltip to appear after the show delay."""
         if self._hide_id:
             self.after_cancel(self._hide_id)
             self._hide_id = None
-        
+
+        if (self._event is not None and event.widget is self._event.widget
+                and text == self._text and (self._visible or self._show_id)):
+            # Re-entry from a crossing inside the same widget (CTk widgets are several
+            # Tk windows): keep the visible tip / pending timer instead of restarting it
+            self._event = event
+            return
+
         if self._show_id:
             self.after_cancel(self._show_id)
             self._show_id = None
 
         self._event = event
         self._text = text
-        
-        self._show_id = self.after(self.show_delay, self._show)
+
+        if self._visible:
+            # Moving straight from one tooltip widget to the next: no second delay
+            self._show()
+        else:
+            self._show_id = self.after(self.show_delay, self._show)
+
+    def attach(self, widget, text):
+        """
+        Shows this tooltip with `text` while the pointer is over `widget`.
+        `text` is a string or a callable returning one (called on each <Enter>, so the
+        tip can follow changing state; an empty result shows nothing).
+        The text is stored on the widget, so calling attach again just updates it.
+        The widget gets the BINDTAG tag instead of its own bindings; tagging the CTk
+        widget's outer frame gives one <Enter>/<Leave> per crossing.
+        """
+        first_attach = not hasattr(widget, '_tooltip_text')
+        widget._tooltip_text = text
+        if first_attach:
+            widget.bindtags((self.BINDTAG,) + widget.bindtags())
+
+    def _on_attached_enter(self, event):
+        """<Enter> handler for the BINDTAG tag; resolves the text from the widget (or a parent)."""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, str):
+            text = getattr(widget, '_tooltip_text', None)
+            if text:
+                if callable(text):
+                    text = text()
+                if text:
+                    self.schedule_show(event, text)
+                return
+            widget = widget.master
 
     def schedule_hide(self, event=None):
         """Schedules the tooltip to hide after the hide delay."""
@@ -71,9 +191,15 @@ class ToolTip(ctk.CTkToplevel):
         x = self._event.x_root + 15 
         y = self._event.y_root + 10 
 
-        self.update_idletasks()
-        tip_height = self.winfo_reqheight()
-        tip_width = self.winfo_reqwidth()
+        # Measuring needs a geometry pass; only do it the first time a text is shown
+        size = self._size_cache.get(self._text)
+        if size is None:
+            self.update_idletasks()
+            size = (self.winfo_reqwidth(), self.winfo_reqheight())
+            if len(self._size_cache) >= self.SIZE_CACHE_LIMIT:
+                self._size_cache.clear()
+            self._size_cache[self._text] = size
+        tip_width, tip_height = size
 
         screen_height = self.winfo_screenheight()
         if y + tip_height > screen_height:
@@ -88,12 +214,14 @@ class ToolTip(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
         self.deiconify()
         self.lift()
+        self._visible = True
         self._show_id = None
 
     def _hide(self):
         """Internal method to hide the window."""
         self._show_id = None
         self._hide_id = None
+        self._visible = False
         try:
             if self.winfo_exists():
                 self.withdraw()
@@ -105,10 +233,15 @@ class BaseDialog(ctk.CTkToplevel):
     Base class for modal dialogs.
     Creates a toplevel window, grabs focus, and waits for a result.
     """
+    # (width, height) for dialogs with a fixed initial geometry; they are centered
+    # from this size instead of measuring themselves
+    DIALOG_SIZE = None
+
     def __init__(self, parent, title="Dialog"):
         super().__init__(parent)
         self.transient(parent)
         self.grab_set()
+        self._has_grab = True # Tracked here so closing needn't ask Tk about the grab
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         self.title(title)
         
@@ -123,15 +256,21 @@ class BaseDialog(ctk.CTkToplevel):
     def _center_window(self):
         """Centers the dialog over its parent window."""
         try:
-            self.update_idletasks()
+            if self.DIALOG_SIZE:
+                # Known size (CTk scales the geometry we set), so nothing to measure
+                dialog_width = self._apply_window_scaling(self.DIALOG_SIZE[0])
+                dialog_height = self._apply_window_scaling(self.DIALOG_SIZE[1])
+            else:
+                # Requested sizes are only propagated at idle time, so flush it first
+                self.update_idletasks()
+                dialog_width = self.winfo_reqwidth()
+                dialog_height = self.winfo_reqheight()
+
             parent_x = self._parent.winfo_x()
             parent_y = self._parent.winfo_y()
             parent_width = self._parent.winfo_width()
             parent_height = self._parent.winfo_height()
             
-            dialog_width = self.winfo_width()
-            dialog_height = self.winfo_height()
-            
             x = parent_x + (parent_width // 2) - (dialog_width // 2)
             y = parent_y + (parent_height // 2) - (dialog_height // 2)
             
@@ -139,16 +278,28 @@ class BaseDialog(ctk.CTkToplevel):
         except Exception as e:
             logging.warning(f"Error centering dialog: {e}")
 
+    def _add_message_label(self, message: str, wraplength=350, justify="left", pady=(0, 20)):
+        """Packs the wrapped message label used at the top of simple dialogs; returns it."""
+        label = ctk.CTkLabel(self.main_frame, text=message, wraplength=wraplength, justify=justify)
+        label.pack(pady=pady, fill="x")
+        return label
+
+    def _release_grab(self):
+        """Releases the modal grab if this dialog took one."""
+        if getattr(self, '_has_grab', False):
+            self._has_grab = False
+            self.grab_release()
+
     def _on_ok(self, event=None):
         """Handles OK button click or Enter key press."""
         self.result = True # Mark as successful
-        self.grab_release()
+        self._release_grab()
         self.destroy()
 
     def _on_cancel(self, event=None):
         """Handles Cancel button click or window close."""
         self.result = None # Mark as cancelled
-        self.grab_release()
+        self._release_grab()
         self.destroy()
 
     def get_input(self):
@@ -160,6 +311,10 @@ class BaseDialog(ctk.CTkToplevel):
 
 class UnlockDialog(BaseDialog):
     """Dialog for entering master password or setting it on first run."""
+    DIALOG_SIZE = (400, 300)
+    # (images dict, show_icon, hide_icon, bg_image, use_image_icons), filled on first dialog
+    _icon_cache = None
+
     def __init__(self, parent, first_run: bool = False, controller=None, title=None):
         # Ensure controller exists before proceeding
         if not controller:
@@ -175,36 +330,18 @@ class UnlockDialog(BaseDialog):
         title = title or ("Create Master Password" if first_run else "Unlock NydusNet")
         super().__init__(parent, title=title) # Call BaseDialog init
 
-        # --- Load images via controller ---
-        self.show_icon = None
-        self.hide_icon = None
-        self.bg_image = None
-        self.use_image_icons = False
-        placeholder_img = None # Define placeholder ref
-        try:
-            if hasattr(self.controller, 'images') and self.controller.images:
-                self.show_icon = self.controller.images.get("eye-show")
-                self.hide_icon = self.controller.images.get("eye-hide")
-                self.bg_image = self.controller.images.get("bg_gradient")
-
-                # Define placeholder image for comparison
-                placeholder_img = ctk.CTkImage(Image.new('RGB', (20,20), color='red'), size=(20,20))._light_image
-
-                # Check if essential icons were loaded (not red squares)
-                if self.show_icon and self.show_icon._light_image != placeholder_img and \
-                   self.hide_icon and self.hide_icon._light_image != placeholder_img:
-                    self.use_image_icons = True
-                else:
-                     raise ValueError("Eye icons loaded as placeholders.")
-            else:
-                raise ValueError("Controller images dictionary is missing or empty.")
-
-        except Exception as e:
-            logging.warning(f"UnlockDialog icons failed ({e}). Using text fallback.")
-            self.show_icon = "👁️" # Text fallback
-            self.hide_icon = "🔒" # Text fallback
-            self.use_image_icons = False
-            self.bg_image = None # Ensure no background if icons failed
+        # --- Load images via controller (validated once, see _resolve_icons) ---
+        self.show_icon, self.hide_icon, self.bg_image, self.use_image_icons = \
+            self._resolve_icons(getattr(self.controller, 'images', None))
+        # Eye button options: built once, used by every toggle button and every click
+        if self.use_image_icons:
+            self._eye_btn_kwargs = {"image": self.show_icon, "text": ""}
+            self._eye_show_kwargs = {"image": self.show_icon}
+            self._eye_hide_kwargs = {"image": self.hide_icon}
+        else:
+            self._eye_btn_kwargs = {"image": None, "text": self.show_icon}
+            self._eye_show_kwargs = {"text": self.show_icon}
+            self._eye_hide_kwargs = {"text": self.hide_icon}
 
         # --- UI Setup ---
         self.grid_rowconfigure(0, weight=1)
@@ -212,8 +349,8 @@ class UnlockDialog(BaseDialog):
 
         # Background Image (Optional)
         bg_frame_fg = "transparent" # Default background
-        # Check if bg_image loaded correctly
-        if self.bg_image and placeholder_img and self.bg_image._light_image != placeholder_img:
+        # bg_image is only set if it loaded correctly (see _resolve_icons)
+        if self.bg_image:
             self.bg_label = ctk.CTkLabel(self, text="", image=self.bg_image)
             self.bg_label.grid(row=0, column=0, sticky="nsew")
             # Determine fg_color based on appearance mode for better contrast on background
@@ -224,95 +361,111 @@ class UnlockDialog(BaseDialog):
         self.main_frame = ctk.CTkFrame(self, corner_radius=10, fg_color=bg_frame_fg)
         self.main_frame.grid(row=0, column=0, padx=30, pady=30, sticky="")
 
-        self.geometry("400x300") # Fixed size
+        self.geometry(f"{self.DIALOG_SIZE[0]}x{self.DIALOG_SIZE[1]}") # Fixed size
         self.resizable(False, False)
 
+        # One default-theme font shared by every label, entry and button below; CTk would
+        # otherwise build a separate CTkFont (and Tk font) for each widget
+        self._font = ctk.CTkFont()
+
         # Create specific UI elements (unlock or setup)
         if self.first_run:
             self._create_password_setup_ui()
-            self.after(100, lambda: self.entry1.focus_set() if self.winfo_exists() else None)
         else:
             self._create_unlock_ui()
-            self.after(100, lambda: self.entry1.focus_set() if self.winfo_exists() else None)
+        # Focus once the pending geometry/map work has run, rather than after a fixed delay
+        self.after_idle(lambda: self.entry1.focus_set() if self.winfo_exists() else None)
+
+    @classmethod
+    def _resolve_icons(cls, images):
+        """
+        Returns (show_icon, hide_icon, bg_image, use_image_icons) for the given images dict.
+        Resolved once per images dict and cached on the class, including the text
+        fallback when the icons are missing.
+        """
+        cached = cls._icon_cache
+        if cached and cached[0] is images:
+            return cached[1:]
+
+        # _load_images() leaves missing or unreadable files out of the dict, so None means missing
+        loaded = images or {}
+        show_icon = loaded.get("eye-show")
+        hide_icon = loaded.get("eye-hide")
+        bg_image = loaded.get("bg_gradient")
+        use_image_icons = show_icon is not None and hide_icon is not None
+        if not use_image_icons:
+            logging.warning("UnlockDialog eye icons are missing. Using text fallback.")
+            show_icon = "👁️" # Text fallback
+            hide_icon = "🔒" # Text fallback
+            bg_image = None # No background without the icons either
+
+        cls._icon_cache = (images, show_icon, hide_icon, bg_image, use_image_icons)
+        return show_icon, hide_icon, bg_image, use_image_icons
 
     def _toggle_password_visibility(self, entry, button):
         if not entry or not button: return
         try:
-            current_show = entry.cget("show")
-            if current_show == "*":
-                entry.configure(show="")
-                button.configure(image=self.hide_icon if self.use_image_icons else None,
-                                 text=self.hide_icon if not self.use_image_icons else "")
-            else:
-                entry.configure(show="*")
-                button.configure(image=self.show_icon if self.use_image_icons else None,
-                                 text=self.show_icon if not self.use_image_icons else "")
+            # Visibility is tracked per entry, so the entry's "show" option needn't be read back
+            visible = not getattr(entry, '_pw_visible', False)
+            entry._pw_visible = visible
+            entry.configure(show="" if visible else "*")
+            button.configure(**(self._eye_hide_kwargs if visible else self._eye_show_kwargs))
         except Exception as e:
              logging.warning(f"Error toggling password visibility: {e}")
 
 
+    def _add_password_row(self, parent, pady=5, on_return=None):
+        """Packs a masked password entry with its eye toggle button and returns (entry, button)."""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(padx=30, pady=pady)
+        entry = ctk.CTkEntry(row, show="*", width=200, font=self._font)
+        entry.pack(side="left")
+        if on_return:
+            entry.bind("<Return>", on_return)
+        button = ctk.CTkButton(row, **self._eye_btn_kwargs, font=self._font,
+                               width=28, anchor="center", # Center icon/text
+                               command=lambda: self._toggle_password_visibility(entry, button))
+        button.pack(side="left", padx=(5, 0))
+        return entry, button
+
     def _create_unlock_ui(self):
         ctk.CTkLabel(self.main_frame, text="NydusNet", font=ctk.CTkFont(size=20, weight="bold")).pack(padx=30, pady=(30, 10))
-        ctk.CTkLabel(self.main_frame, text="Enter Master Password:").pack(padx=30, pady=(10, 0))
-
-        entry_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        entry_frame.pack(padx=30, pady=10)
+        ctk.CTkLabel(self.main_frame, text="Enter Master Password:", font=self._font).pack(padx=30, pady=(10, 0))
 
-        self.entry1 = ctk.CTkEntry(entry_frame, show="*", width=200)
-        self.entry1.pack(side="left")
-        self.entry1.bind("<Return>", self._on_ok)
+        self.entry1, _ = self._add_password_row(self.main_frame, pady=10, on_return=self._on_ok)
         # Focus is set by app.py using after(150, ...)
 
-        toggle_btn1 = ctk.CTkButton(entry_frame, image=self.show_icon if self.use_image_icons else None,
-                                    text=self.show_icon if not self.use_image_icons else "",
-                                    width=28, anchor="center", # Center icon/text
-                                    command=lambda: self._toggle_password_visibility(self.entry1, toggle_btn1))
-        toggle_btn1.pack(side="left", padx=(5, 0))
-
         button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         button_frame.pack(padx=30, pady=(10, 20))
 
-        ctk.CTkButton(button_frame, text="Unlock", command=self._on_ok, width=110).pack(side="left", padx=5)
-        ctk.CTkButton(button_frame, text="Forgot Password?", command=self._on_forgot, width=110, fg_color="transparent", border_width=1).pack(side="left", padx=5)
+        ctk.CTkButton(button_frame, text="Unlock", command=self._on_ok, width=110, font=self._font).pack(side="left", padx=5)
+        ctk.CTkButton(button_frame, text="Forgot Password?", command=self._on_forgot, width=110, font=self._font, fg_color="transparent", border_width=1).pack(side="left", padx=5)
 
     def _create_password_setup_ui(self):
         ctk.CTkLabel(self.main_frame, text="Welcome to NydusNet", font=ctk.CTkFont(size=20, weight="bold")).pack(padx=30, pady=(30, 10))
-        ctk.CTkLabel(self.main_frame, text="Create a New Master Password:").pack(padx=30, pady=(10, 0))
+        ctk.CTkLabel(self.main_frame, text="Create a New Master Password:", font=self._font).pack(padx=30, pady=(10, 0))
 
-        entry_frame1 = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        entry_frame1.pack(padx=30, pady=5)
-        self.entry1 = ctk.CTkEntry(entry_frame1, show="*", width=200)
-        self.entry1.pack(side="left")
+        self.entry1, _ = self._add_password_row(self.main_frame)
         # Focus is set by app.py using after(150, ...)
-        toggle_btn1 = ctk.CTkButton(entry_frame1, image=self.show_icon if self.use_image_icons else None, text=self.show_icon if not self.use_image_icons else "", width=28, anchor="center", command=lambda: self._toggle_password_visibility(self.entry1, toggle_btn1))
-        toggle_btn1.pack(side="left", padx=(5, 0))
-
-        ctk.CTkLabel(self.main_frame, text="Confirm Master Password:").pack(padx=30, pady=(10, 0))
-        entry_frame2 = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        entry_frame2.pack(padx=30, pady=5)
-        self.entry2 = ctk.CTkEntry(entry_frame2, show="*", width=200)
-        self.entry2.pack(side="left")
-        self.entry2.bind("<Return>", self._on_ok)
-        toggle_btn2 = ctk.CTkButton(entry_frame2, image=self.show_icon if self.use_image_icons else None, text=self.show_icon if not self.use_image_icons else "", width=28, anchor="center", command=lambda: self._toggle_password_visibility(self.entry2, toggle_btn2))
-        toggle_btn2.pack(side="left", padx=(5, 0))
+
+        ctk.CTkLabel(self.main_frame, text="Confirm Master Password:", font=self._font).pack(padx=30, pady=(10, 0))
+        self.entry2, _ = self._add_password_row(self.main_frame, on_return=self._on_ok)
 
         ctk.CTkLabel(self.main_frame, text="Allowed: A-Z a-z 0-9 Space !@#$%^&*()_+-=[]{}|;:,.<>?", font=("", 10), wraplength=250).pack(padx=30, pady=5)
-        ctk.CTkButton(self.main_frame, text="Create", command=self._on_ok, width=230).pack(padx=30, pady=20)
+        ctk.CTkButton(self.main_frame, text="Create", command=self._on_ok, width=230, font=self._font).pack(padx=30, pady=20)
 
     def _on_ok(self, event=None):
         # Validate password input
         password = self.entry1.get() # Get password from first entry
         if self.first_run:
             password2 = self.entry2.get()
-            # Regex includes space now
-            allowed_chars = r"^[A-Za-z0-9 !@#$%^&*()_+\-=\[\]{}|;:,.<>?]*$"
             if password != password2:
                 ErrorDialog(self, message="Passwords do not match.")
                 return # Keep dialog open
             if not password: # Check if empty
                 ErrorDialog(self, message="Password cannot be empty.")
                 return
-            if not re.fullmatch(allowed_chars, password):
+            if not password_chars_allowed(password):
                 ErrorDialog(self, message="Password contains invalid characters.\nAllowed: A-Z a-z 0-9 Space !@#$%^&*()_+-=[]{}|;:,.<>?")
                 return
 
@@ -335,9 +488,11 @@ class UnlockDialog(BaseDialog):
 
 class LoadingDialog(BaseDialog):
     """Modal dialog showing an indeterminate progress bar."""
+    DIALOG_SIZE = (400, 300)
+
     def __init__(self, parent, title="Loading..."):
         super().__init__(parent, title=title)
-        self.geometry("400x300")
+        self.geometry(f"{self.DIALOG_SIZE[0]}x{self.DIALOG_SIZE[1]}")
         self.resizable(False, False)
 
         # Center content using grid
@@ -425,12 +580,16 @@ class ProvisionDialog(BaseDialog):
              return
              
         self.result = {"user": user, "password": password, "email": email}
-        self.grab_release()
+        self._release_grab()
         self.destroy()
 
 
 class LogViewerDialog(BaseDialog):
     """A non-modal dialog to display log content."""
+    DIALOG_SIZE = (700, 500) # Initial size; the log viewer is resizable
+    # Large logs are inserted in newline-aligned chunks of about this size, one per after() tick
+    LOG_INSERT_CHUNK = 64 * 1024
+
     def __init__(self, parent, log_content: str, title="View Logs"):
         # Override BaseDialog __init__ for non-modal behavior
         super(BaseDialog, self).__init__(parent) # Call CTkToplevel init
@@ -450,11 +609,11 @@ class LogViewerDialog(BaseDialog):
 
         self.textbox = ctk.CTkTextbox(self.main_frame, wrap="none", font=("Courier New", 12))
         self.textbox.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.textbox.insert("1.0", log_content or "No log content available.")
-        self.textbox.configure(state="disabled")
-        
-        # Auto-scroll to end
-        self.textbox.see("end")
+        # Auto-scrolls to the end once everything queued has been inserted
+        self._writer = ChunkedTextWriter(self.textbox, self.LOG_INSERT_CHUNK,
+                                         on_drained=lambda: self.textbox.see("end"))
+        # Inserts the first chunk now; the rest follows via after()
+        self._writer.append(log_content or "No log content available.")
 
         button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         button_frame.grid(row=1, column=0, pady=(0, 10))
@@ -466,10 +625,20 @@ class LogViewerDialog(BaseDialog):
         
         # --- Center and show (since get_input isn't called) ---
         self.resizable(True, True)
-        self.geometry("700x500") # Start with a good size for logs
+        self.geometry(f"{self.DIALOG_SIZE[0]}x{self.DIALOG_SIZE[1]}") # Start with a good size for logs
         self._center_window()
         self.ok_button.focus_set()
 
+    def _append_text(self, text: str):
+        """Appends text to the read-only textbox, queued behind any chunks still pending."""
+        self._writer.append(text)
+
+    def destroy(self):
+        """Drops any chunks still queued so no insert fires on the destroyed textbox."""
+        if getattr(self, '_writer', None) is not None:
+            self._writer.cancel()
+        super().destroy()
+
     def get_input(self):
         """Override to just show the window, not wait."""
         # This dialog is non-modal, so get_input shouldn't be called.
@@ -488,17 +657,31 @@ class ProvisioningLogDialog(LogViewerDialog):
         
         self.ok_button.configure(state="disabled") # Can't close until done
         self.all_logs = ["Starting provisioning...\n"]
+        self._pending_lines = [] # Lines received since the last flush
+        self._flush_id = None
 
     def update_log(self, log_lines: list):
-        """Appends new lines to the log."""
+        """Appends new lines to the log. Calls made before the next idle are written together."""
         if not self.textbox or not self.textbox.winfo_exists(): return
         
-        self.textbox.configure(state="normal")
-        for line in log_lines:
-            self.all_logs.append(line)
-            self.textbox.insert("end", line + "\n")
-        self.textbox.configure(state="disabled")
-        self.textbox.see("end")
+        self.all_logs.extend(log_lines)
+        self._pending_lines.extend(log_lines)
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Writes the lines collected by update_log with a single append."""
+        self._flush_id = None
+        if not self._pending_lines or not self.textbox.winfo_exists(): return
+        lines, self._pending_lines = self._pending_lines, []
+        self._append_text("".join(line + "\n" for line in lines))
+
+    def destroy(self):
+        """Cancels a pending log flush before closing."""
+        if getattr(self, '_flush_id', None) is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
 
     def complete(self, success: bool):
         """Marks the provisioning as complete."""
@@ -506,17 +689,19 @@ class ProvisioningLogDialog(LogViewerDialog):
         
         self.progressbar.stop()
         self.progressbar.grid_remove()
+
+        # Write any lines still waiting for the idle flush before the status banner
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+        self._flush_log()
         
-        self.textbox.configure(state="normal")
         if success:
-            self.textbox.insert("end", "\n--- PROVISIONING COMPLETE (SUCCESS) ---\n")
+            self._append_text("\n--- PROVISIONING COMPLETE (SUCCESS) ---\n")
             self.title(f"Provisioning Succeeded: {self.title().split(': ')[1]}")
         else:
-            self.textbox.insert("end", "\n--- PROVISIONING FAILED ---\n")
+            self._append_text("\n--- PROVISIONING FAILED ---\n")
             self.title(f"Provisioning FAILED: {self.title().split(': ')[1]}")
         
-        self.textbox.configure(state="disabled")
-        self.textbox.see("end")
         self.ok_button.configure(state="normal") # Enable close button
 
 class ServerDialog(BaseDialog):
@@ -551,9 +736,7 @@ class ServerDialog(BaseDialog):
         self.tunnel_user_entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
         
         if self.tooltip:
-             tooltip_text = "Optional: Override the default 'tunnel' user. Leave blank for default."
-             self.tunnel_user_entry.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-             self.tunnel_user_entry.bind("<Leave>", self.tooltip.schedule_hide)
+             self.tooltip.attach(self.tunnel_user_entry, "Optional: Override the default 'tunnel' user. Leave blank for default.")
 
         # --- *** UPDATED "MANUALLY CONFIGURED" CHECKBOX *** ---
         row += 1
@@ -625,11 +808,15 @@ class ServerDialog(BaseDialog):
         # Set 'is_provisioned' from checkbox
         self.result['is_provisioned'] = self.is_provisioned_var.get()
         
-        self.grab_release()
+        self._release_grab()
         self.destroy()
 
 class TunnelDialog(BaseDialog):
     """Dialog to add or edit a Tunnel configuration."""
+    # (server_choices, servers_map, server_names, server_names_by_id) from the last open;
+    # reused while the controller hands back the same cached choices tuple
+    _server_lookup_cache = None
+
     def __init__(self, parent, controller, title="Add Tunnel", initial_data=None):
         super().__init__(parent, title=title)
         
@@ -642,8 +829,11 @@ class TunnelDialog(BaseDialog):
 
         # --- Get data for dropdowns ---
         self.client_map, self.client_names = self.controller.get_clients_for_dropdown()
-        self.servers_map = {s.get('name', 'N/A'): s.get('id', 'N/A') for s in self.controller.get_servers()}
-        self.server_names = sorted(self.servers_map.keys())
+        self.servers_map, self.server_names, self.server_names_by_id = \
+            self._server_lookups(self.controller.get_server_choices())
+        self.client_names_by_id = {}
+        for name, client_id in self.client_map.items():
+            self.client_names_by_id.setdefault(client_id, name)
 
         # --- Form Frame ---
         form_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -669,13 +859,9 @@ class TunnelDialog(BaseDialog):
 
 
         row += 1
-        ctk.CTkLabel(form_frame, text="Hostname:").grid(row=row, column=0, padx=10, pady=5, sticky="w")
-        self.hostname_entry = ctk.CTkEntry(form_frame, placeholder_text="e.g., 'app.example.com'")
-        self.hostname_entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
-        if self.tooltip:
-             tooltip_text = "The public-facing domain name (e.g., 'sms.mydomain.com')."
-             self.hostname_entry.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-             self.hostname_entry.bind("<Leave>", self.tooltip.schedule_hide)
+        _, self.hostname_entry = self._add_entry_row(
+            form_frame, row, "Hostname:", "e.g., 'app.example.com'",
+            "The public-facing domain name (e.g., 'sms.mydomain.com').")
 
         row += 1
         ctk.CTkLabel(form_frame, text="Server:").grid(row=row, column=0, padx=10, pady=5, sticky="w")
@@ -686,11 +872,9 @@ class TunnelDialog(BaseDialog):
 
         # --- Dynamic Label for Port ---
         row += 1
-        self.port_label = ctk.CTkLabel(form_frame, text="Remote Port:") # Will be updated by toggle
-        self.port_label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
-        
-        self.remote_port_entry = ctk.CTkEntry(form_frame, placeholder_text="e.g., 8080 or 5000")
-        self.remote_port_entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+        # Label text and tooltip are set by _on_type_change
+        self.port_label, self.remote_port_entry = self._add_entry_row(
+            form_frame, row, "Remote Port:", "e.g., 8080 or 5000")
 
         # --- Client Device (Hidden for Local) ---
         row += 1
@@ -704,23 +888,14 @@ class TunnelDialog(BaseDialog):
 
         # --- Local Destination (Hidden for Local) ---
         row += 1
-        self.local_dest_label = ctk.CTkLabel(form_frame, text="Local Destination:")
-        self.local_dest_label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
-        
-        self.local_dest_entry = ctk.CTkEntry(form_frame, placeholder_text="e.g., 'localhost:8080'")
-        self.local_dest_entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+        self.local_dest_label, self.local_dest_entry = self._add_entry_row(
+            form_frame, row, "Local Destination:", "e.g., 'localhost:8080'")
 
         # --- Extra Service Ports (e.g. LiveKit WebSocket) ---
         row += 1
-        self.extra_ports_label = ctk.CTkLabel(form_frame, text="Extra Service Ports:")
-        self.extra_ports_label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
-
-        self.extra_ports_entry = ctk.CTkEntry(form_frame, placeholder_text="e.g., '7880:localhost:7880'")
-        self.extra_ports_entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
-        if self.tooltip:
-             tooltip_text = "Optional extra public:local port pairs for WSS services like LiveKit (comma separated)."
-             self.extra_ports_entry.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-             self.extra_ports_entry.bind("<Leave>", self.tooltip.schedule_hide)
+        self.extra_ports_label, self.extra_ports_entry = self._add_entry_row(
+            form_frame, row, "Extra Service Ports:", "e.g., '7880:localhost:7880'",
+            "Optional extra public:local port pairs for WSS services like LiveKit (comma separated).")
 
         # --- Auto Start ---
         row += 1
@@ -731,26 +906,25 @@ class TunnelDialog(BaseDialog):
 
 
         # --- Load initial data ---
-        self.hostname_entry.insert(0, self.initial_data.get("hostname", ""))
-        self.remote_port_entry.insert(0, self.initial_data.get("remote_port", ""))
-        self.local_dest_entry.insert(0, self.initial_data.get("local_destination", ""))
-        self.extra_ports_entry.insert(0, self.initial_data.get("extra_ports", ""))
+        initial = self.initial_data
+        self.hostname_entry.insert(0, initial.get("hostname", ""))
+        self.remote_port_entry.insert(0, initial.get("remote_port", ""))
+        self.local_dest_entry.insert(0, initial.get("local_destination", ""))
+        self.extra_ports_entry.insert(0, initial.get("extra_ports", ""))
         
         # Set server dropdown
-        initial_server_id = self.initial_data.get("server_id")
-        for name, server_id in self.servers_map.items():
-            if server_id == initial_server_id:
-                self.server_menu.set(name); break
+        initial_server_name = self.server_names_by_id.get(initial.get("server_id"))
+        if initial_server_name:
+            self.server_menu.set(initial_server_name)
         
         # Set client dropdown
-        initial_client_id = self.initial_data.get("client_device_id")
-        for name, client_id in self.client_map.items():
-            if client_id == initial_client_id:
-                self.client_menu.set(name); break
+        initial_client_name = self.client_names_by_id.get(initial.get("client_device_id"))
+        if initial_client_name:
+            self.client_menu.set(initial_client_name)
         
         # Set auto-start (Handle 'auto_start_on_device_ids' logic)
         my_device_id = self.controller.get_my_device_id()
-        auto_start_list = self.initial_data.get("auto_start_on_device_ids", [])
+        auto_start_list = initial.get("auto_start_on_device_ids", [])
         if my_device_id in auto_start_list:
              self.auto_start_var.set("on")
         else:
@@ -773,6 +947,36 @@ class TunnelDialog(BaseDialog):
         self.hostname_entry.focus_set()
         self.bind("<Return>", self._on_ok)
 
+    @classmethod
+    def _server_lookups(cls, server_choices):
+        """
+        Returns (servers_map, server_names, server_names_by_id) for the cached, sorted
+        (name, id) server choices. The controller replaces that tuple on every config
+        reload, so its identity tells us whether the last build can be reused.
+        """
+        cached = cls._server_lookup_cache
+        if cached and cached[0] is server_choices:
+            return cached[1:]
+
+        servers_map = dict(server_choices) # {name: id}
+        server_names = [name for name, _ in server_choices]
+        server_names_by_id = {} # {id: name}, for selecting the initial server
+        for name, server_id in server_choices:
+            server_names_by_id.setdefault(server_id, name)
+
+        cls._server_lookup_cache = (server_choices, servers_map, server_names, server_names_by_id)
+        return servers_map, server_names, server_names_by_id
+
+    def _add_entry_row(self, form_frame, row, label_text, placeholder, tooltip_text=None):
+        """Grids a label + entry pair on the given form row; returns (label, entry)."""
+        label = ctk.CTkLabel(form_frame, text=label_text)
+        label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
+        entry = ctk.CTkEntry(form_frame, placeholder_text=placeholder)
+        entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+        if tooltip_text and self.tooltip:
+            self.tooltip.attach(entry, tooltip_text)
+        return label, entry
+
     def _on_type_change(self, value):
         """Updates UI elements based on selected route type."""
         is_local = (value == "Local VPS Service")
@@ -781,8 +985,7 @@ class TunnelDialog(BaseDialog):
             # Local Route Mode
             self.port_label.configure(text="App Port (VPS):")
             if self.tooltip:
-                tooltip_text = "The port your service is listening on localhost (e.g., 5000)."
-                self.remote_port_entry.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
+                self.tooltip.attach(self.remote_port_entry, "The port your service is listening on localhost (e.g., 5000).")
             
             # Hide Tunnel-specific fields
             self.client_label.grid_remove()
@@ -798,8 +1001,7 @@ class TunnelDialog(BaseDialog):
             # Tunnel Mode
             self.port_label.configure(text="Remote Port:")
             if self.tooltip:
-                 tooltip_text = "The port the *server* will listen on. Must be unique."
-                 self.remote_port_entry.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
+                 self.tooltip.attach(self.remote_port_entry, "The port the *server* will listen on. Must be unique.")
 
             # Show Tunnel-specific fields
             self.client_label.grid()
@@ -841,8 +1043,8 @@ class TunnelDialog(BaseDialog):
         if not server_name or server_name == "No servers configured":
              ErrorDialog(self, title="Input Error", message="A server must be selected.")
              return
-        if not remote_port.isdigit():
-             ErrorDialog(self, title="Input Error", message="Port must be a number.")
+        if not _valid_port(remote_port):
+             ErrorDialog(self, title="Input Error", message="Port must be a number between 1 and 65535.")
              return
         
         server_id = self.servers_map.get(server_name)
@@ -850,8 +1052,8 @@ class TunnelDialog(BaseDialog):
              ErrorDialog(self, title="Internal Error", message="Could not map server name to an ID.")
              return
 
-        # Prepare Result Dict
-        self.result = self.initial_data.copy()
+        # Prepare Result Dict (published as self.result only once everything validated)
+        result = self.initial_data.copy()
         
         if route_mode == "tunnel":
             local_dest = self.local_dest_entry.get().strip()
@@ -865,20 +1067,20 @@ class TunnelDialog(BaseDialog):
                  return
             
             client_device_id = self.client_map.get(client_name)
-            self.result.update({
+            result.update({
                 "local_destination": local_dest,
                 "client_device_id": client_device_id,
             })
         else:
             # Local Mode: Clear tunnel-specific fields to avoid confusion
-            self.result.update({
+            result.update({
                 "local_destination": "",
                 "client_device_id": self.controller.get_my_device_id(), # Assign to self so we can control it
             })
 
         # --- Handle auto-start list ---
         my_device_id = self.controller.get_my_device_id()
-        auto_start_list = self.initial_data.get("auto_start_on_device_ids", []).copy()
+        auto_start_list = list(result.get("auto_start_on_device_ids", []))
         
         if auto_start: 
             if my_device_id not in auto_start_list:
@@ -887,7 +1089,7 @@ class TunnelDialog(BaseDialog):
             if my_device_id in auto_start_list:
                  auto_start_list.remove(my_device_id)
 
-        self.result.update({
+        result.update({
             "hostname": hostname,
             "server_id": server_id,
             "remote_port": remote_port, # In local mode, this is the App Port
@@ -897,11 +1099,16 @@ class TunnelDialog(BaseDialog):
             "route_type": route_mode # New Field
         })
         
-        self.grab_release()
+        self.result = result
+        self._release_grab()
         self.destroy()
 
 class InviteDialog(BaseDialog):
     """Displays a Syncthing invite QR code and text."""
+    QR_SIZE = 250 # Displayed QR code width/height in pixels
+    QR_CACHE_LIMIT = 8
+    _qr_cache = {} # {invite_string: CTkImage}; reopening an invite skips the QR render
+
     def __init__(self, parent, invite_string: str, title="Invite Device"):
         super().__init__(parent, title=title)
         
@@ -909,24 +1116,15 @@ class InviteDialog(BaseDialog):
         
         ctk.CTkLabel(self.main_frame, text="Scan this QR code or copy the string to sync another device:").pack(pady=(0, 10))
         
-        # --- Generate QR Code ---
-        try:
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data(self.invite_string)
-            qr.make(fit=True)
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert PIL image to CTkImage
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format='PNG')
-            qr_image = ctk.CTkImage(Image.open(img_byte_arr), size=(250, 250))
-            
-            qr_label = ctk.CTkLabel(self.main_frame, image=qr_image, text="")
-            qr_label.pack(pady=10)
-            
-        except Exception as e:
-            logging.error(f"Failed to generate QR code: {e}")
-            ctk.CTkLabel(self.main_frame, text="Failed to generate QR code.").pack(pady=10)
+        # --- QR Code (rendered on a worker thread, installed by _install_qr) ---
+        self.qr_label = ctk.CTkLabel(self.main_frame, text="Generating QR code...",
+                                     width=self.QR_SIZE, height=self.QR_SIZE)
+        self.qr_label.pack(pady=10)
+        cached_qr = self._qr_cache.get(invite_string)
+        if cached_qr is not None:
+            self.qr_label.configure(image=cached_qr, text="")
+        else:
+            threading.Thread(target=self._generate_qr, daemon=True).start()
         
         # --- Invite String Entry ---
         entry_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -947,6 +1145,45 @@ class InviteDialog(BaseDialog):
         ok_button.pack(pady=10)
         ok_button.focus_set()
 
+    def _generate_qr(self):
+        """Worker thread: renders the invite QR code as a QR_SIZE square PIL image."""
+        try:
+            import qrcode # Imported on first use; only invite dialogs need it
+            from PIL import Image
+            qr = qrcode.QRCode(version=1, border=4)
+            qr.add_data(self.invite_string)
+            qr.make(fit=True)
+            # Pick the largest whole box size that fits, so modules stay crisp squares
+            modules = qr.modules_count + 2 * qr.border
+            qr.box_size = max(1, self.QR_SIZE // modules)
+            qr_img = qr.make_image(fill_color="black", back_color="white").get_image()
+
+            # Centre it on a white QR_SIZE square rather than resampling, which would
+            # make some modules a pixel wider than others (no PNG round trip either)
+            img = Image.new(qr_img.mode, (self.QR_SIZE, self.QR_SIZE), "white")
+            offset = (self.QR_SIZE - qr_img.width) // 2
+            img.paste(qr_img, (offset, offset))
+        except Exception as e:
+            logging.error(f"Failed to generate QR code: {e}")
+            img = None
+        try:
+            self.after(0, self._install_qr, img)
+        except RuntimeError:
+            pass # Main loop already gone (app closing)
+
+    def _install_qr(self, img):
+        """Shows the rendered QR code, or the failure message, in place of the placeholder."""
+        if not self.qr_label.winfo_exists(): return # Dialog closed while rendering
+        if img is None:
+            self.qr_label.configure(text="Failed to generate QR code.")
+            return
+        qr_image = ctk.CTkImage(img, size=(self.QR_SIZE, self.QR_SIZE))
+        cache = InviteDialog._qr_cache
+        if len(cache) >= self.QR_CACHE_LIMIT:
+            cache.pop(next(iter(cache))) # Drop the oldest invite
+        cache[self.invite_string] = qr_image
+        self.qr_label.configure(image=qr_image, text="")
+
     def _copy_invite(self):
         try:
             self.clipboard_clear()
@@ -962,7 +1199,7 @@ class ConfirmationDialog(BaseDialog):
     def __init__(self, parent, title="Confirm?", message="Are you sure?"):
         super().__init__(parent, title=title)
         
-        ctk.CTkLabel(self.main_frame, text=message, wraplength=350, justify="left").pack(pady=(0, 20), fill="x")
+        self._add_message_label(message)
         
         button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         button_frame.pack(pady=10)
@@ -984,8 +1221,8 @@ class RecoveryKeyDialog(BaseDialog):
     def __init__(self, parent, recovery_key: str, title="Recovery Key"):
         super().__init__(parent, title=title)
         
-        ctk.CTkLabel(self.main_frame, text="Save this key somewhere safe!\nIt's the only way to recover your account.",
-                       wraplength=400, justify="center").pack(pady=(0, 10))
+        self._add_message_label("Save this key somewhere safe!\nIt's the only way to recover your account.",
+                                wraplength=400, justify="center", pady=(0, 10))
                        
         key_frame = ctk.CTkFrame(self.main_frame, fg_color=("gray90", "gray20"))
         key_frame.pack(fill="x", padx=10, pady=10)
@@ -1017,7 +1254,7 @@ class ErrorDialog(BaseDialog):
     def __init__(self, parent, title="Error", message="An error occurred."):
         super().__init__(parent, title=title)
         
-        ctk.CTkLabel(self.main_frame, text=message, wraplength=350, justify="left").pack(pady=(0, 20), fill="x")
+        self._add_message_label(message)
         
         ok_button = ctk.CTkButton(self.main_frame, text="OK", command=self._on_ok, width=100)
         ok_button.pack(pady=10)
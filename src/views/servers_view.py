@@ -43,8 +43,10 @@ class ServersView(ctk.CTkFrame):
         self.list_container.grid_rowconfigure(0, weight=1)
         self.list_container.grid_columnconfigure(0, weight=1)
 
-        # --- Scrollable Frame (Created in load_servers) ---
-        self.server_list_frame = None 
+        # --- Scrollable Frame (Created once, children rebuilt in load_servers) ---
+        self.server_list_frame = ctk.CTkScrollableFrame(self.list_container, label_text="Registered Servers")
+        self.server_list_frame.grid(row=0, column=0, sticky="nsew")
+        self.server_list_frame.grid_columnconfigure(0, weight=1) # Allow content to expand horizontally
 
     def on_enter(self):
         """Called every time the view is shown."""
@@ -58,7 +60,7 @@ class ServersView(ctk.CTkFrame):
         self._clear_server_list()
 
     def _clear_server_list(self):
-        """Destroys all server item widgets inside the scrollable frame."""
+        """Destroys all server item widgets inside the (persistent) scrollable frame."""
         # Hide tooltip immediately if shown
         if self.tooltip:
              try:
@@ -73,29 +75,33 @@ class ServersView(ctk.CTkFrame):
                 try:
                    if widget.winfo_exists(): widget.destroy()
                 except Exception: pass
-            # Destroy the frame itself
-            try:
-                 self.server_list_frame.destroy()
-            except Exception: pass
-                 
-        self.server_list_frame = None # Reset reference
+            # Keep the scrollable frame itself: its canvas, scrollbar and
+            # bindings are expensive to rebuild on every refresh.
+
         self.server_item_frames.clear() # Clear the cache
 
     def load_servers(self):
         """Loads server data from controller and populates the UI list."""
         logging.info("Loading servers into view...")
-        self._clear_server_list() # Clear previous frame and items
-
-        # --- Re-create scrollable frame ---
-        if not hasattr(self, 'list_container') or not self.list_container or not self.list_container.winfo_exists():
-             logging.error("Cannot load servers, list_container not found.")
+        if not self.server_list_frame or not self.server_list_frame.winfo_exists():
+             logging.error("Cannot load servers, server_list_frame not found.")
              return 
 
-        self.server_list_frame = ctk.CTkScrollableFrame(self.list_container, label_text="Registered Servers")
-        self.server_list_frame.grid(row=0, column=0, sticky="nsew")
-        self.server_list_frame.grid_columnconfigure(0, weight=1) # Allow content to expand horizontally
-        # --- End Frame Creation ---
+        # Detach the list while rebuilding so Tk never paints the empty/half-built
+        # state; it is re-gridded in one step once fully populated.
+        self.server_list_frame.grid_remove()
+        try:
+            self._clear_server_list() # Clear previous items (frame is reused)
+            # Reset scroll position so a shorter list isn't shown scrolled past its end
+            try:
+                self.server_list_frame._parent_canvas.yview_moveto(0)
+            except Exception: pass
+            self._populate_server_list()
+        finally:
+            self.server_list_frame.grid()
 
+    def _populate_server_list(self):
+        """Creates the item widgets for every server (list frame is detached by the caller)."""
         try:
             servers = self.controller.get_servers() # Get data from App controller
             if not servers:
@@ -145,8 +151,7 @@ class ServersView(ctk.CTkFrame):
                     # --- FIX: Bind to setup_btn, not edit_btn ---
                     if self.tooltip:
                         tooltip_text = f"Re-provision {server_name}" if is_provisioned else f"Run Setup for {server_name}"
-                        setup_btn.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-                        setup_btn.bind("<Leave>", self.tooltip.schedule_hide)
+                        self.tooltip.attach(setup_btn, tooltip_text)
 
                     # --- Edit Button (always shown) ---
                     edit_icon = self.images.get("edit")
@@ -157,9 +162,7 @@ class ServersView(ctk.CTkFrame):
 
                     # --- FIX: Tooltip binding moved *after* button creation ---
                     if self.tooltip:
-                        tooltip_text = f"Edit {server_name}"
-                        edit_btn.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-                        edit_btn.bind("<Leave>", self.tooltip.schedule_hide)
+                        self.tooltip.attach(edit_btn, f"Edit {server_name}")
 
                     # --- Delete Button (always shown) ---
                     delete_icon = self.images.get("delete")
@@ -171,9 +174,7 @@ class ServersView(ctk.CTkFrame):
                     
                     # --- FIX: Tooltip binding moved *after* button creation ---
                     if self.tooltip:
-                        tooltip_text = f"Delete {server_name}"
-                        delete_btn.bind("<Enter>", lambda e, text=tooltip_text: self.tooltip.schedule_show(e, text))
-                        delete_btn.bind("<Leave>", self.tooltip.schedule_hide)
+                        self.tooltip.attach(delete_btn, f"Delete {server_name}")
 
 
                 except Exception as e: